@@ -11,8 +11,8 @@ Project Overview
 Script Purpose
 --------------
     This `__init__.py` file serves as the main entry point for the `py_guitar_synth` package. It imports essential
-    components including default instruments, pre-configured guitar sheets, core types, and signal processing
-    functions, making them available at the package level for easy access.
+    components including core types and signal processing functions, and exposes the default instruments and
+    pre-configured guitar sheets at the package level. The latter are only loaded from the assets when first accessed.
 
 Author
 ------
@@ -20,10 +20,46 @@ Author
     Email: mustafa.alotbah@gmail.com
 """
 
-from .instruments import default_classical_guitar, default_impulse_response, default_piano, default_violine
-from .sheets import law_bass_f_aini, agua_marina
+import importlib
 from .types import *
-from .instrument_parser import load_impulse_response, load_instrument_from_json
+from .instrument_parser import load_impulse_response, load_instrument_from_json, load_instrument_from_string
 from .signal_processing import generate_guitar_signal_from_sheet, to_guitar_sequence, convolve_with_impulse_response, \
-    add_echo, normalize_audio
-from .tab_parser import parse_guitar_tab_from_file
\ No newline at end of file
+    add_echo, normalize_audio, stream_guitar_signal_from_sheet, StreamingConvolver, StreamingEcho, StreamingNormalizer
+from .tab_parser import parse_guitar_tab_from_file, parse_guitar_tab_from_lines, parse_guitar_tab_from_string
+
+# Default instruments and sheets, loaded from the assets on first access
+LAZY_ATTRIBUTES = {
+    'default_classical_guitar': 'instruments',
+    'default_impulse_response': 'instruments',
+    'default_piano': 'instruments',
+    'default_violine': 'instruments',
+    'law_bass_f_aini': 'sheets',
+    'agua_marina': 'sheets',
+}
+
+__all__ = [
+    'default_classical_guitar', 'default_impulse_response', 'default_piano', 'default_violine',
+    'law_bass_f_aini', 'agua_marina',
+    'NoteValue', 'TransitionType', 'PluckStyle', 'PlayStyle',
+    'Stroke', 'SequenceElement', 'NoteEvent', 'NoteArrays', 'GuitarSheet', 'String', 'StringBank', 'Instrument',
+    'load_impulse_response', 'load_instrument_from_json', 'load_instrument_from_string',
+    'generate_guitar_signal_from_sheet', 'to_guitar_sequence', 'convolve_with_impulse_response', 'add_echo',
+    'normalize_audio', 'stream_guitar_signal_from_sheet', 'StreamingConvolver', 'StreamingEcho', 'StreamingNormalizer',
+    'parse_guitar_tab_from_file', 'parse_guitar_tab_from_lines', 'parse_guitar_tab_from_string',
+]
+
+
+def __getattr__(name):
+    """
+    Resolve the default instruments and sheets lazily (PEP 562), so that `import py_guitar_synth` stays cheap.
+    """
+    if name not in LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(f".{LAZY_ATTRIBUTES[name]}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(LAZY_ATTRIBUTES))
@@ -1,31 +1,123 @@
 import argparse
+import queue
 import sounddevice as sd
+import sys
 import threading
 
+from functools import partial
 from py_guitar_synth import (
-    default_classical_guitar,
-    default_violine,
-    default_piano,
-    law_bass_f_aini,
-    agua_marina,
     generate_guitar_signal_from_sheet,
+    stream_guitar_signal_from_sheet,
     parse_guitar_tab_from_file
 )
+from py_guitar_synth.instruments import get_default_classical_guitar, get_default_violine, get_default_piano
+from py_guitar_synth.sheets import load_sheet
 
-# Dictionary mapping instrument names to instrument objects
+# Number of samples per block when streaming
+STREAM_BLOCK_SIZE = 4096
+
+# Dictionary mapping instrument names to the functions loading them, so that only the chosen one is parsed
 INSTRUMENTS = {
-    'classical_guitar': default_classical_guitar,
-    'violin': default_violine,
-    'piano': default_piano
+    'classical_guitar': get_default_classical_guitar,
+    'violin': get_default_violine,
+    'piano': get_default_piano
 }
 
-# Dictionary mapping sheet names to GuitarSheet objects
+# Dictionary mapping sheet names to the functions loading their GuitarSheet objects
 SHEETS = {
-    'law_bass_f_aini': law_bass_f_aini,
-    'agua_marina': agua_marina
+    'law_bass_f_aini': partial(load_sheet, 'law_bass_f_aini'),
+    'agua_marina': partial(load_sheet, 'agua_marina')
 }
 
 
+def wait_until_finished(finished):
+    if sys.platform != 'win32':
+        finished.wait()
+        return
+
+    # An unbounded wait cannot be interrupted with Ctrl+C on Windows, so wake up once a second to let it through
+    while not finished.wait(1):
+        pass
+
+
+def play_signal(signal, sr):
+    # View the signal as (frames, channels) so mono and stereo signals are streamed alike
+    frames_signal = signal.reshape(len(signal), -1)
+    position = 0
+    finished = threading.Event()
+
+    def callback(outdata, frames, time, status):
+        nonlocal position
+
+        # Copy the next block straight out of the rendered signal, padding the last block with silence
+        block = frames_signal[position:position + frames]
+        outdata[:len(block)] = block
+        outdata[len(block):] = 0
+        position += len(block)
+
+        if position >= len(frames_signal):
+            raise sd.CallbackStop()
+
+    # The stream pulls blocks on demand, so the signal is never copied into a playback buffer
+    with sd.OutputStream(
+            samplerate=sr, channels=frames_signal.shape[1], callback=callback, finished_callback=finished.set
+    ):
+        wait_until_finished(finished)
+
+
+def stream_signal(blocks, sr):
+    # The channel count of the stream is that of the first rendered block
+    first_block = next(blocks, None)
+    if first_block is None:
+        return
+    channels = first_block.reshape(len(first_block), -1).shape[1]
+
+    # Render ahead of playback in a producer thread, a bounded queue caps the memory held by pending blocks
+    pending = queue.Queue(maxsize=32)
+    pending.put(first_block)
+
+    # Errors of the renderer are handed over to the main thread, to be raised once playback stops
+    errors = []
+
+    def produce():
+        try:
+            for block in blocks:
+                pending.put(block)
+        except Exception as error:
+            errors.append(error)
+        finally:
+            # Always end the stream, even when rendering fails
+            pending.put(None)
+
+    threading.Thread(target=produce, daemon=True).start()
+    finished = threading.Event()
+
+    def callback(outdata, frames, time, status):
+        # Output silence when rendering falls behind playback
+        try:
+            block = pending.get_nowait()
+        except queue.Empty:
+            outdata[:] = 0
+            return
+
+        if block is None:
+            outdata[:] = 0
+            raise sd.CallbackStop()
+
+        block = block.reshape(len(block), -1)
+        outdata[:len(block)] = block
+        outdata[len(block):] = 0
+
+    with sd.OutputStream(
+            samplerate=sr, channels=channels, blocksize=STREAM_BLOCK_SIZE, callback=callback,
+            finished_callback=finished.set
+    ):
+        wait_until_finished(finished)
+
+    if errors:
+        raise errors[0]
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="py_guitar_synth: A tool for synthesizing guitar audio from tab sheets."
@@ -84,16 +176,22 @@ def main():
         help="Set the echo decay factor (default: 0.2)."
     )
 
+    # Option to play while rendering
+    parser.add_argument(
+        '--stream', action='store_true',
+        help="Render the sheet block by block while playing it, instead of rendering it fully first."
+    )
+
     args = parser.parse_args()
 
     # Load the selected instrument and sheet
-    instrument = INSTRUMENTS[args.instrument]
+    instrument = INSTRUMENTS[args.instrument]()
 
     print(f"Reading Sheet {args.sheet}")
 
     # Load the sheet, either from predefined sheets or from a file
     if args.sheet in SHEETS:
-        sheet = SHEETS[args.sheet]
+        sheet = SHEETS[args.sheet]()
     else:
         # Attempt to load the sheet from a file path
         try:
@@ -102,8 +200,8 @@ def main():
             print(f"Error loading sheet from '{args.sheet}': {e}")
             return
 
-    # Generate the guitar signal
-    signal = generate_guitar_signal_from_sheet(
+    # Rendering options shared by the one-shot and the streaming renderer
+    options = dict(
         instrument=instrument,
         sheet=sheet,
         pluck_position=args.pluck_position,
@@ -115,22 +213,18 @@ def main():
         echo_decay=args.echo_decay
     )
 
-    def play():
-        # Play the generated audio using sounddevice
-        print(f"Playing '{sheet.title}' by '{sheet.author}' with {args.instrument}...")
-        sd.play(signal, args.sr)
-        sd.wait()
-
-    # Start the playback in a separate thread
-    play_thread = threading.Thread(target=play)
-    play_thread.start()
+    if not args.stream:
+        # Generate the guitar signal
+        signal = generate_guitar_signal_from_sheet(**options)
 
-    # Main thread continues to run
+    # Play the generated audio using sounddevice, interrupting playback closes the stream
+    print(f"Playing '{sheet.title}' by '{sheet.author}' with {args.instrument}...")
     try:
-        while play_thread.is_alive():
-            play_thread.join(timeout=1)
+        if args.stream:
+            stream_signal(stream_guitar_signal_from_sheet(**options, block_size=STREAM_BLOCK_SIZE), args.sr)
+        else:
+            play_signal(signal, args.sr)
     except KeyboardInterrupt:
-        sd.stop()
         print("Playback stopped.")
 
 
@@ -11,25 +11,37 @@ Project Overview
 Script Purpose
 --------------
     This script provides utility functions for loading instrument data and impulse responses. The `load_instrument_from_json`
-    function parses JSON files defining the physical properties of instruments, while `load_impulse_response` loads
-    impulse response files for simulating the acoustic characteristics of different environments.
+    function parses JSON files (and `load_instrument_from_string` JSON content) defining the physical properties of
+    instruments, while `load_impulse_response` loads impulse response files for simulating the acoustic characteristics
+    of different environments.
 
 Author
 ------
     Mustafa Alotbah
     Email: mustafa.alotbah@gmail.com
 """
-import re
+import os
 import json
 import numpy as np
+from typing import BinaryIO, Optional, TextIO, Union
 import soundfile as sf
-from py_guitar_synth.types import Instrument, String
+from py_guitar_synth.types import Instrument, String, StringBank
+
+# Use the faster orjson parser when available; its errors subclass json.JSONDecodeError
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
 
 
 def remove_json_comments(json_content: str) -> str:
     """
     Remove line comments (//) from a JSON content string to clean it for parsing.
 
+    The content is scanned once, jumping between string delimiters and comment markers with `str.find`,
+    so that `//` sequences inside string literals (e.g. URLs) are preserved.
+
     Parameters
     ----------
     json_content : str
@@ -40,19 +52,63 @@ def remove_json_comments(json_content: str) -> str:
     str
         The cleaned JSON content, with all comments removed.
     """
-    # Use a regular expression to remove all instances of // comments
-    pattern = r'//.*?$'
-    return re.sub(pattern, '', json_content, flags=re.MULTILINE)
-
-
-def load_instrument_from_json(file_path: str) -> Instrument:
+    pieces = []
+    start = 0  # Beginning of the slice that has not been copied yet
+    position = 0  # Current scanning position
+    length = len(json_content)
+    comment = json_content.find('//')
+
+    while comment != -1:
+        quote = json_content.find('"', position, comment)
+
+        if quote != -1:
+            # A string literal opens before the comment: skip over it, respecting escaped characters
+            position = quote + 1
+            while True:
+                closing = json_content.find('"', position)
+                if closing == -1:
+                    position = length
+                    break
+
+                # Count the backslashes preceding the quote to know whether it is escaped
+                backslashes = 0
+                while json_content[closing - 1 - backslashes] == '\\':
+                    backslashes += 1
+
+                position = closing + 1
+                if backslashes % 2 == 0:
+                    break
+
+            # The '//' found earlier may have been part of the string literal
+            if comment < position:
+                comment = json_content.find('//', position)
+            continue
+
+        # Keep everything up to the comment and resume at the end of the line
+        pieces.append(json_content[start:comment])
+        end_of_line = json_content.find('\n', comment)
+        if end_of_line == -1:
+            start = length
+            break
+
+        start = position = end_of_line
+        comment = json_content.find('//', position)
+
+    pieces.append(json_content[start:])
+    return ''.join(pieces)
+
+
+def load_instrument_from_string(json_content: str, string_bank: Optional[StringBank] = None) -> Instrument:
     """
-    Load and parse an instrument's physical properties from a JSON file, constructing an Instrument object.
+    Parse an instrument's physical properties from JSON content (possibly containing // comments),
+    constructing an Instrument object.
 
     Parameters
     ----------
-    file_path : str
-        The path to the JSON file that contains the instrument's definition.
+    json_content : str
+        The JSON content that contains the instrument's definition.
+    string_bank : StringBank, optional
+        The structure-of-arrays view of the strings, e.g. from a cache; built from the parsed strings by default.
 
     Returns
     -------
@@ -63,12 +119,10 @@ def load_instrument_from_json(file_path: str) -> Instrument:
     Raises
     ------
     json.JSONDecodeError
-        If the JSON file contains invalid syntax (e.g., malformed structure after comment removal).
+        If the JSON content contains invalid syntax (e.g., malformed structure after comment removal).
     """
-    with open(file_path, 'r') as file:
-        raw_content = file.read()
-        cleaned_content = remove_json_comments(raw_content)  # Remove comments
-        data = json.loads(cleaned_content)  # Load JSON after removing comments
+    cleaned_content = remove_json_comments(json_content)  # Remove comments
+    data = json_loads(cleaned_content)  # Load JSON after removing comments
 
     strings = []
     for string_data in data["strings"]:
@@ -93,24 +147,67 @@ def load_instrument_from_json(file_path: str) -> Instrument:
     return Instrument(
         supports_transitions=data["supports_transitions"],
         supports_vibrato=data["supports_vibrato"],
-        strings=strings
+        strings=strings,
+        string_bank=string_bank
     )
 
 
-def load_impulse_response(ir_file: str) -> np.ndarray:
+def load_instrument_from_json(
+        file_path: Union[str, os.PathLike, TextIO],
+        string_bank: Optional[StringBank] = None
+) -> Instrument:
+    """
+    Load and parse an instrument's physical properties from a JSON file, constructing an Instrument object.
+
+    Parameters
+    ----------
+    file_path : str, os.PathLike or TextIO
+        The path to the JSON file that contains the instrument's definition, or an open text file holding it
+        (e.g. a package resource opened with `Traversable.open()`).
+    string_bank : StringBank, optional
+        The structure-of-arrays view of the strings, e.g. from a cache; built from the parsed strings by default.
+
+    Returns
+    -------
+    Instrument
+        An `Instrument` object representing the physical characteristics and capabilities of the instrument,
+        including string properties, support for transitions, and vibrato.
+
+    Raises
+    ------
+    json.JSONDecodeError
+        If the JSON file contains invalid syntax (e.g., malformed structure after comment removal).
+    """
+    if hasattr(file_path, 'read'):
+        return load_instrument_from_string(file_path.read(), string_bank)
+
+    with open(file_path, 'r') as file:
+        return load_instrument_from_string(file.read(), string_bank)
+
+
+def load_impulse_response(ir_file: Union[str, os.PathLike, BinaryIO]) -> np.ndarray:
     """
     Load an impulse response from a WAV file, representing the acoustic signature of a room or space,
     which will be used to impart spatial characteristics to the synthesized guitar tone.
 
+    The samples are decoded directly into a preallocated single-precision buffer, which halves the memory held
+    by the impulse response compared to the default double-precision decoding.
+
     Parameters
     ----------
-    ir_file : str
-        The path to the impulse response WAV file, often recorded in various acoustically treated environments.
+    ir_file : str, os.PathLike or BinaryIO
+        The path to the impulse response WAV file, often recorded in various acoustically treated environments,
+        or a seekable binary file-like object (e.g. `io.BytesIO`) holding the WAV content.
 
     Returns
     -------
     np.ndarray
-        The impulse response array, a 1D or 2D NumPy array representing the room's acoustic fingerprint.
+        The impulse response array (float32), a 1D (mono) or 2D (frames x channels) NumPy array
+        representing the room's acoustic fingerprint.
     """
-    ir, _ = sf.read(ir_file)
-    return ir
+    with sf.SoundFile(ir_file) as file:
+        ir = np.empty((file.frames, file.channels), dtype=np.float32)
+        file.read(out=ir)
+
+    # Mono impulse responses are returned as 1D arrays
+    return ir[:, 0] if file.channels == 1 else ir
@@ -13,30 +13,308 @@ Script Purpose
     This script loads various instruments' physical and acoustic properties from JSON files, which are then used
     in the guitar synthesis process. It also loads an impulse response WAV file for convolution to emulate real
     room acoustics. Pre-defined instruments like `default_classical_guitar`, `default_violine`, and `default_piano`
-    are available for use in music generation.
+    are available for use in music generation. Each asset is only loaded the first time it is accessed, and the
+    arrays of parsed assets are cached in a per-user cache directory (`.npz` and `.npy` files, see
+    `cache_directory`), so subsequent runs skip the WAV decoding and the construction of the string banks.
 
 Author
 ------
     Mustafa Alotbah
     Email: mustafa.alotbah@gmail.com
 """
+import os
 import sys
+import hashlib
+import pathlib
+import tempfile
+import numpy as np
+from dataclasses import fields
+from functools import lru_cache
 import importlib.resources as resources
+from typing import Any, Callable, Union
+from py_guitar_synth import types
+from py_guitar_synth.__version__ import __version__
 from py_guitar_synth.instrument_parser import load_instrument_from_json, load_impulse_response
 
 if sys.version_info < (3, 10):
     import importlib_resources as resources
 
-# Load the JSON file with the guitar's physical properties
-with resources.as_file(resources.files('py_guitar_synth.assets').joinpath('classical_guitar.json')) as f:
-    default_classical_guitar = load_instrument_from_json(str(f))
 
-with resources.as_file(resources.files('py_guitar_synth.assets').joinpath('violine.json')) as f:
-    default_violine = load_instrument_from_json(str(f))
+def cache_directory() -> str:
+    """
+    Get the directory holding the cached assets: `$PY_GUITAR_SYNTH_CACHE_DIR` if set, otherwise a `py_guitar_synth`
+    directory in the per-user cache directory (`%LOCALAPPDATA%` on Windows, `$XDG_CACHE_HOME` or `~/.cache`
+    elsewhere).
 
-with resources.as_file(resources.files('py_guitar_synth.assets').joinpath('piano.json')) as f:
-    default_piano = load_instrument_from_json(str(f))
+    Returns
+    -------
+    str
+        The path to the cache directory, which may not exist yet.
+    """
+    if os.environ.get('PY_GUITAR_SYNTH_CACHE_DIR'):
+        return os.environ['PY_GUITAR_SYNTH_CACHE_DIR']
 
-# Load a WAV file (impulse response)
-with resources.as_file(resources.files('py_guitar_synth.assets').joinpath('ir.wav')) as wav_path:
-    default_impulse_response = load_impulse_response(str(wav_path))
+    if sys.platform == 'win32':
+        base = os.environ.get('LOCALAPPDATA') or os.path.expanduser(os.path.join('~', 'AppData', 'Local'))
+    else:
+        base = os.environ.get('XDG_CACHE_HOME') or os.path.expanduser(os.path.join('~', '.cache'))
+    return os.path.join(base, 'py_guitar_synth')
+
+
+def cache_path_for(source_path: Union[str, os.PathLike], extension: str) -> str:
+    """
+    Get the path of the cached form of an asset. The name of the source file is kept for readability, followed by
+    a digest of its content, of the package version and of the layout of `StringBank`, so that a cache entry is
+    only ever used for the exact source and code that produced it, whatever the modification times.
+
+    Parameters
+    ----------
+    source_path : str or os.PathLike
+        The path to the original asset.
+    extension : str
+        The extension of the cached form, e.g. '.npz'.
+
+    Returns
+    -------
+    str
+        The path to the cached asset in `cache_directory()`.
+    """
+    digest = hashlib.sha1()
+    with open(source_path, 'rb') as file:
+        digest.update(file.read())
+    digest.update(__version__.encode('utf-8'))
+    digest.update(' '.join(f.name for f in fields(types.StringBank)).encode('utf-8'))
+
+    stem = os.path.splitext(os.path.basename(source_path))[0]
+    return os.path.join(cache_directory(), f"{stem}-{digest.hexdigest()[:16]}{extension}")
+
+
+def cached_load(
+        source_path: str,
+        cache_path: str,
+        loader: Callable[[str], Any],
+        dump: Callable[[Any, Any], None],
+        load: Callable[[str], Any]
+) -> Any:
+    """
+    Load an asset from its on-disk cache when it exists, otherwise parse the source, write the cache and load the
+    asset back from it, so that the result has the same form either way. If the cache cannot be written, the
+    parsed asset is returned as is.
+
+    Parameters
+    ----------
+    source_path : str
+        The path to the original asset.
+    cache_path : str
+        The path where the pre-parsed asset is stored, in the cache directory (see `cache_path_for`).
+    loader : Callable[[str], Any]
+        The function parsing the source file, e.g. `load_instrument_from_json`.
+    dump : Callable[[Any, Any], None]
+        The function writing the parsed asset into an open binary file.
+    load : Callable[[str], Any]
+        The function reading the parsed asset back from the cache path.
+
+    Returns
+    -------
+    Any
+        The parsed asset.
+    """
+    if os.path.exists(cache_path):
+        try:
+            return load(cache_path)
+        except Exception:
+            pass  # A corrupted cache is simply rebuilt
+
+    value = loader(source_path)
+
+    # Write to a temporary file of its own first, so that concurrent loads (processes or threads) never read or
+    # write a partial cache
+    temporary_path = None
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        descriptor, temporary_path = tempfile.mkstemp(dir=os.path.dirname(cache_path), suffix='.tmp')
+        with os.fdopen(descriptor, 'wb') as file:
+            dump(value, file)
+        os.replace(temporary_path, cache_path)
+    except OSError:
+        return value  # The cache directory may not be writable, the asset is then parsed on every run
+    finally:
+        # Never leave a partial cache behind, whatever interrupted the write
+        if temporary_path is not None and os.path.exists(temporary_path):
+            os.remove(temporary_path)
+
+    return load(cache_path)
+
+
+def load_cached_instrument(json_path: Union[str, os.PathLike]) -> types.Instrument:
+    """
+    Load an instrument definition, using the arrays of its string bank stored in the cache directory when
+    available. The instrument itself is always parsed from its (small) JSON file, only plain arrays are cached.
+
+    Parameters
+    ----------
+    json_path : str or os.PathLike
+        The path to the JSON file that contains the instrument's definition.
+
+    Returns
+    -------
+    Instrument
+        The parsed `Instrument` object.
+    """
+    def dump(instrument: types.Instrument, file) -> None:
+        np.savez(file, **{f.name: getattr(instrument.string_bank, f.name) for f in fields(types.StringBank)})
+
+    def load(cache_path: str) -> types.Instrument:
+        with np.load(cache_path, allow_pickle=False) as arrays:
+            string_bank = types.StringBank(**{name: arrays[name] for name in arrays.files})
+        return load_instrument_from_json(json_path, string_bank=string_bank)
+
+    return cached_load(
+        source_path=json_path,
+        cache_path=cache_path_for(json_path, '.npz'),
+        loader=load_instrument_from_json,
+        dump=dump,
+        load=load
+    )
+
+
+def load_cached_impulse_response(wav_path: Union[str, os.PathLike]) -> np.ndarray:
+    """
+    Load an impulse response, using a memory-mapped `.npy` copy stored in the cache directory.
+
+    Parameters
+    ----------
+    wav_path : str or os.PathLike
+        The path to the impulse response WAV file.
+
+    Returns
+    -------
+    np.ndarray
+        The impulse response array, read-only and memory-mapped from the cache (or decoded in memory if the cache
+        directory is not writable).
+    """
+    return cached_load(
+        source_path=wav_path,
+        cache_path=cache_path_for(wav_path, '.npy'),
+        loader=load_impulse_response,
+        dump=lambda ir, file: np.save(file, ir),
+        load=lambda cache_path: np.load(cache_path, mmap_mode='r', allow_pickle=False)
+    )
+
+
+def load_default_instrument(file_name: str) -> types.Instrument:
+    """
+    Load an instrument from the package assets. On regular installations the assets are plain files and the
+    on-disk cache is used; on zipped installations the JSON resource is opened and parsed in place, without
+    extracting it to a temporary file.
+
+    Parameters
+    ----------
+    file_name : str
+        The name of the JSON file in the assets directory, e.g. 'classical_guitar.json'.
+
+    Returns
+    -------
+    Instrument
+        The parsed `Instrument` object.
+    """
+    resource = resources.files('py_guitar_synth.assets').joinpath(file_name)
+    if isinstance(resource, pathlib.Path):
+        return load_cached_instrument(resource)
+    with resource.open('r') as file:
+        return load_instrument_from_json(file)
+
+
+def load_default_impulse_response(file_name: str) -> np.ndarray:
+    """
+    Load an impulse response from the package assets, using the on-disk cache on regular installations and
+    decoding the WAV resource in place on zipped installations.
+
+    Parameters
+    ----------
+    file_name : str
+        The name of the WAV file in the assets directory, e.g. 'ir.wav'.
+
+    Returns
+    -------
+    np.ndarray
+        The impulse response array.
+    """
+    resource = resources.files('py_guitar_synth.assets').joinpath(file_name)
+    if isinstance(resource, pathlib.Path):
+        return load_cached_impulse_response(resource)
+    with resource.open('rb') as file:
+        return load_impulse_response(file)
+
+
+@lru_cache(maxsize=None)
+def get_default_classical_guitar() -> types.Instrument:
+    """
+    Load the default classical guitar, parsed once on first use.
+
+    Returns
+    -------
+    Instrument
+        The classical guitar defined in `assets/classical_guitar.json`.
+    """
+    return load_default_instrument('classical_guitar.json')
+
+
+@lru_cache(maxsize=None)
+def get_default_violine() -> types.Instrument:
+    """
+    Load the default violin, parsed once on first use.
+
+    Returns
+    -------
+    Instrument
+        The violin defined in `assets/violine.json`.
+    """
+    return load_default_instrument('violine.json')
+
+
+@lru_cache(maxsize=None)
+def get_default_piano() -> types.Instrument:
+    """
+    Load the default piano, parsed once on first use.
+
+    Returns
+    -------
+    Instrument
+        The piano defined in `assets/piano.json`.
+    """
+    return load_default_instrument('piano.json')
+
+
+@lru_cache(maxsize=None)
+def get_default_impulse_response() -> np.ndarray:
+    """
+    Load the default impulse response, decoded once on first use.
+
+    Returns
+    -------
+    np.ndarray
+        The impulse response stored in `assets/ir.wav`.
+    """
+    return load_default_impulse_response('ir.wav')
+
+
+# Module attributes resolved lazily, so that importing this module does not load every asset
+DEFAULT_ASSETS = {
+    'default_classical_guitar': get_default_classical_guitar,
+    'default_violine': get_default_violine,
+    'default_piano': get_default_piano,
+    'default_impulse_response': get_default_impulse_response,
+}
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Load a default asset on first access of the corresponding module attribute (PEP 562).
+    """
+    if name not in DEFAULT_ASSETS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = DEFAULT_ASSETS[name]()
+    globals()[name] = value
+    return value
@@ -11,9 +11,9 @@ Project Overview
 Script Purpose
 --------------
     This script is responsible for loading pre-defined guitar sheets (tabs) from text files stored in the assets
-    directory. The guitar sheets are parsed into `GuitarSheet` objects using the `parse_guitar_tab_from_file` function,
-    which will later be used to synthesize guitar music. It ensures that the sheets, such as 'law_bass' and 'agua_marina',
-    are ready for further processing and playback.
+    directory. The guitar sheets are parsed into `GuitarSheet` objects using the `parse_guitar_tab_from_string` function,
+    which will later be used to synthesize guitar music. The sheets, such as 'law_bass' and 'agua_marina', are parsed
+    the first time they are accessed, so that importing the package does not pay for sheets that are never played.
 
 Author
 ------
@@ -22,19 +22,49 @@ Author
 """
 import sys
 import importlib.resources as resources
-from py_guitar_synth.tab_parser import parse_guitar_tab_from_file
+from functools import lru_cache
+from py_guitar_synth.types import GuitarSheet
+from py_guitar_synth.tab_parser import parse_guitar_tab_from_string
 
 if sys.version_info < (3, 10):
     import importlib_resources as resources
 
-# Load the 'law_bass.txt' tab file
-with resources.as_file(resources.files('py_guitar_synth.assets').joinpath('law_bass.txt')) as f:
-    law_bass_f_aini = parse_guitar_tab_from_file(str(f))
 
-# Load the 'agua_marina.txt' tab file
-with resources.as_file(resources.files('py_guitar_synth.assets').joinpath('agua_marina.txt')) as f:
-    agua_marina = parse_guitar_tab_from_file(str(f))
+# Tab files of the pre-defined sheets, resolved lazily as module attributes
+SHEET_FILES = {
+    'law_bass_f_aini': 'law_bass.txt',
+    'agua_marina': 'agua_marina.txt',
+    'osad_eini': 'osad_eini.txt',
+}
 
-# Load the 'agua_marina.txt' tab file
-with resources.as_file(resources.files('py_guitar_synth.assets').joinpath('osad_eini.txt')) as f:
-    osad_eini = parse_guitar_tab_from_file(str(f))
\ No newline at end of file
+
+@lru_cache(maxsize=None)
+def load_sheet(name: str) -> GuitarSheet:
+    """
+    Parse one of the pre-defined guitar sheets from the assets directory, once per sheet.
+
+    Parameters
+    ----------
+    name : str
+        The name of the sheet, one of the keys of `SHEET_FILES` (e.g. 'law_bass_f_aini').
+
+    Returns
+    -------
+    GuitarSheet
+        The parsed guitar sheet.
+    """
+    # Read the tab in place, which avoids extracting a temporary file on zipped installations
+    resource = resources.files('py_guitar_synth.assets').joinpath(SHEET_FILES[name])
+    return parse_guitar_tab_from_string(resource.read_text())
+
+
+def __getattr__(name: str) -> GuitarSheet:
+    """
+    Parse a pre-defined sheet on first access of the corresponding module attribute (PEP 562).
+    """
+    if name not in SHEET_FILES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    sheet = load_sheet(name)
+    globals()[name] = sheet
+    return sheet
@@ -20,11 +20,30 @@ Author
     Mustafa Alotbah
     Email: mustafa.alotbah@gmail.com
 """
+import os
+import tempfile
+import weakref
 import numpy as np
-from typing import List, Optional
-from py_guitar_synth.types import Stroke, SequenceElement, Instrument, String, GuitarSheet
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+from py_guitar_synth.types import SequenceElement, Stroke, Instrument, String, StringBank, GuitarSheet, \
+    NoteEvent, NoteArrays
 from py_guitar_synth.instrument_parser import load_impulse_response
-from py_guitar_synth.instruments import default_impulse_response
+from py_guitar_synth.instruments import get_default_impulse_response
+
+# Use the multithreaded pocketfft of scipy when available, falling back to the single-threaded NumPy FFT
+try:
+    import scipy.fft
+
+    def rfft(a: np.ndarray, n: Optional[int] = None, axis: int = -1) -> np.ndarray:
+        return scipy.fft.rfft(a, n=n, axis=axis, workers=-1)
+
+    def irfft(a: np.ndarray, n: Optional[int] = None, axis: int = -1) -> np.ndarray:
+        return scipy.fft.irfft(a, n=n, axis=axis, workers=-1)
+except ImportError:
+    rfft = np.fft.rfft
+    irfft = np.fft.irfft
 
 
 def add_echo(signal: np.ndarray, delay: float, decay: float, sr: int = 44100) -> np.ndarray:
@@ -51,29 +70,147 @@ def add_echo(signal: np.ndarray, delay: float, decay: float, sr: int = 44100) ->
     delay_samples = int(delay * sr)  # Convert delay in seconds to samples
 
     if len(signal.shape) == 2:
-        # Stereo signal: Apply echo separately to each channel
-        left_channel = np.zeros(len(signal) + delay_samples)
-        right_channel = np.zeros(len(signal) + delay_samples)
+        # Stereo signal: Apply echo to both channels at once, keeping the frames x channels layout
+        echo_signal = np.zeros((len(signal) + delay_samples, signal.shape[1]), dtype=np.float32)
 
         # Add the original signal
-        left_channel[:len(signal)] = signal[:, 0]
-        right_channel[:len(signal)] = signal[:, 1]
+        echo_signal[:len(signal)] = signal
 
         # Add the delayed and decayed echo
-        left_channel[delay_samples:] += signal[:, 0] * decay
-        right_channel[delay_samples:] += signal[:, 1] * decay
+        echo_signal[delay_samples:] += signal * decay
 
-        return np.vstack((left_channel, right_channel)).T  # Combine left and right channels
+        return echo_signal
 
     else:
-        # Mono signal: Apply echo directly
-        echo_signal = np.zeros(len(signal) + delay_samples)
-        echo_signal[:len(signal)] = signal
+        # Mono signal: Apply echo directly, the echo tail beyond the end of the signal is dropped
+        echo_signal = np.array(signal, dtype=np.float32)
 
         # Add the delayed and decayed echo
-        echo_signal[delay_samples:] += signal * decay
+        echo_signal[delay_samples:] += signal[:max(0, len(signal) - delay_samples)] * decay
+
+        return echo_signal
+
+
+# Impulse responses with an echo folded in, keyed by (id(ir), delay_samples, decay) and tied to the IR with a weak
+# reference, so that their partition spectra stay cached as well
+echo_impulse_response_cache: Dict[Tuple[int, int, float], Tuple[weakref.ref, np.ndarray]] = {}
+
+
+def echo_impulse_response(ir: np.ndarray, delay: float, decay: float, sr: int = 44100) -> np.ndarray:
+    """
+    Fold an echo into an impulse response: convolving a signal with `ir + decay * shift(ir, delay)` is the same as
+    convolving it with `ir` and adding the echo, so both effects are applied by a single convolution.
+    The result is cached for as long as the impulse response array is alive.
+
+    Parameters
+    ----------
+    ir : np.ndarray
+        The impulse response, either mono (1D) or multichannel (2D, frames x channels).
+    delay : float
+        The delay time of the echo in seconds.
+    decay : float
+        The decay factor of the echo.
+    sr : int, optional
+        The sample rate of the impulse response, default is 44100 Hz.
+
+    Returns
+    -------
+    np.ndarray
+        The impulse response followed by its delayed and decayed copy, `int(delay * sr)` frames longer than `ir`.
+    """
+    delay_samples = int(delay * sr)
+    key = (id(ir), delay_samples, decay)
+    cached = echo_impulse_response_cache.get(key)
+    if cached is not None and cached[0]() is ir:
+        return cached[1]
+
+    echo_ir = np.zeros((len(ir) + delay_samples,) + ir.shape[1:], dtype=np.float32)
+    echo_ir[:len(ir)] = ir
+    echo_ir[delay_samples:] += decay * ir
 
-        return echo_signal[:len(signal)]
+    def evict(reference, cache_key=key):
+        # Drop the echo impulse response once the impulse response is garbage collected
+        if echo_impulse_response_cache.get(cache_key, (None,))[0] is reference:
+            del echo_impulse_response_cache[cache_key]
+
+    echo_impulse_response_cache[key] = (weakref.ref(ir, evict), echo_ir)
+    return echo_ir
+
+
+class StreamingEcho:
+    """
+    Block-wise counterpart of `add_echo`: a delay line holding the last `delay` seconds of input, so that the echo
+    of a long signal can be applied one block at a time. The echo tail beyond the end of the input is dropped.
+
+    Parameters
+    ----------
+    delay : float
+        The delay time of the echo in seconds.
+    decay : float
+        The decay factor, controlling how much quieter the echo is relative to the original sound.
+    sr : int, optional
+        The sample rate of the signal, default is 44100 Hz.
+    """
+
+    def __init__(self, delay: float, decay: float, sr: int = 44100):
+        self.delay_samples = int(delay * sr)
+        self.decay = decay
+        self.history: Optional[np.ndarray] = None
+
+    def process_block(self, block: np.ndarray) -> np.ndarray:
+        """
+        Apply the echo to the next block of the signal.
+
+        Parameters
+        ----------
+        block : np.ndarray
+            The next block of the signal, either mono (1D) or multichannel (2D, frames x channels).
+
+        Returns
+        -------
+        np.ndarray
+            The block with the delayed and decayed echo of the preceding input added.
+        """
+        if self.history is None:
+            self.history = np.zeros((self.delay_samples,) + block.shape[1:], dtype=block.dtype)
+
+        # The delayed input is the delay line followed by the block itself
+        delayed = np.concatenate((self.history, block))
+        self.history = delayed[len(delayed) - self.delay_samples:]
+
+        return block + delayed[:len(block)] * self.decay
+
+
+def next_fast_len(n: int) -> int:
+    """
+    Find the smallest FFT length of at least `n` whose only prime factors are 2, 3 and 5, for which the radix
+    kernels of the FFT are fastest; an exact length with a large prime factor can be many times slower.
+
+    Parameters
+    ----------
+    n : int
+        The minimal length of the transform.
+
+    Returns
+    -------
+    int
+        The smallest 5-smooth integer greater than or equal to `n`.
+    """
+    if n <= 1:
+        return 1
+
+    best = 1 << (n - 1).bit_length()  # The next power of two is always a candidate
+    power_of_5 = 1
+    while power_of_5 < best:
+        power_of_35 = power_of_5
+        while power_of_35 < best:
+            # Smallest power of two bringing this odd part to at least n
+            candidate = power_of_35 << max(0, (-(-n // power_of_35) - 1).bit_length())
+            best = min(best, candidate)
+            power_of_35 *= 3
+        power_of_5 *= 5
+
+    return best
 
 
 def fftconvolve(x: np.ndarray, y: np.ndarray) -> np.ndarray:
@@ -81,70 +218,280 @@ def fftconvolve(x: np.ndarray, y: np.ndarray) -> np.ndarray:
     Perform frequency-domain convolution utilizing the Fast Fourier Transform (FFT) algorithm,
     optimal for large-scale convolutions in musical signal processing.
 
+    The inputs are real, so real-input transforms are used (half the spectrum of a complex FFT), computed at a
+    5-smooth length from `next_fast_len`. A multichannel `y` is transformed in one batched call along its frames,
+    and the spectrum of `x` is computed once for all channels.
+
     Parameters
     ----------
     x : np.ndarray
-        Input array representing the first signal or waveform in the time domain.
+        Input array representing the first signal or waveform in the time domain (1D).
     y : np.ndarray
-        Input array representing the second signal or impulse response to be convolved.
+        Input array representing the second signal or impulse response to be convolved, either mono (1D) or
+        multichannel (2D, frames x channels).
 
     Returns
     -------
     np.ndarray
         The resultant convolved signal, computed via the convolution theorem, using the product of Fourier transforms.
+        It has the channels of `y`.
     """
 
-    # Compute the size of the output
+    # Compute the size of the output and of the transforms
     n = len(x) + len(y) - 1
-
-    # Perform the FFT on both signals with padding
-    X = np.fft.fft(x, n=n)
-    Y = np.fft.fft(y, n=n)
+    fft_size = next_fast_len(n)
 
     # Convolution theorem: multiplication in the frequency domain corresponds to convolution.
-    result_freq = X * Y
+    x_freq = rfft(x, n=fft_size)
+    result_freq = rfft(y, n=fft_size, axis=0)
+    result_freq *= x_freq.reshape((-1,) + (1,) * (result_freq.ndim - 1))
+
+    # The inverse real FFT returns the real-valued result to the time domain.
+    return irfft(result_freq, n=fft_size, axis=0)[:n]
+
 
-    # Inverse FFT returns the result to the time domain.
-    result = np.fft.ifft(result_freq)
+# Number of samples per partition in the partitioned impulse response convolution
+CONVOLUTION_BLOCK_SIZE = 4096
 
-    # Convolution produces a real-valued result.
-    return np.real(result)
+# Number of signal samples whose block spectra are held at once by the one-shot partitioned convolution
+CONVOLUTION_BATCH_SIZE = 1 << 18
 
+# Spectra of the partitioned impulse responses, keyed by (id(ir), block_size) and tied to the IR with a weak reference
+impulse_response_spectra_cache: Dict[Tuple[int, int], Tuple[weakref.ref, np.ndarray]] = {}
 
-def convolve_with_impulse_response(signal: np.ndarray, ir: np.ndarray) -> np.ndarray:
+
+def impulse_response_spectra(ir: np.ndarray, block_size: int = CONVOLUTION_BLOCK_SIZE) -> np.ndarray:
+    """
+    Split an impulse response into consecutive partitions of `block_size` samples and compute the spectrum of each
+    partition, as required by the uniformly partitioned convolution. The result is cached for as long as the impulse
+    response array is alive, so that rendering several sheets with the same room only transforms it once.
+
+    Parameters
+    ----------
+    ir : np.ndarray
+        The impulse response, either mono (1D) or multichannel (2D, frames x channels).
+    block_size : int, optional
+        The partition length in samples; the spectra are computed with an FFT size of `2 * block_size`.
+
+    Returns
+    -------
+    np.ndarray
+        Complex array of shape (channels, partitions, block_size + 1) holding the partition spectra.
+    """
+    key = (id(ir), block_size)
+    cached = impulse_response_spectra_cache.get(key)
+    if cached is not None and cached[0]() is ir:
+        return cached[1]
+
+    # Zero-pad every channel to a whole number of partitions
+    channels = ir.reshape(len(ir), -1).T
+    num_partitions = max(1, -(-len(ir) // block_size))
+    partitions = np.zeros((channels.shape[0], num_partitions * block_size), dtype=np.float32)
+    partitions[:, :len(ir)] = channels
+
+    spectra = rfft(partitions.reshape(channels.shape[0], num_partitions, block_size), n=2 * block_size, axis=2)
+
+    def evict(reference, cache_key=key):
+        # Drop the spectra once the impulse response is garbage collected
+        if impulse_response_spectra_cache.get(cache_key, (None,))[0] is reference:
+            del impulse_response_spectra_cache[cache_key]
+
+    impulse_response_spectra_cache[key] = (weakref.ref(ir, evict), spectra)
+    return spectra
+
+
+def convolution_block_size(signal_length: int, ir_length: int) -> int:
+    """
+    Choose the partition length of the convolution for a one-shot render. Each block costs two FFTs of twice the
+    block length plus one spectral product per impulse response partition, so small blocks spend their time in the
+    frequency-domain delay line and blocks longer than the impulse response in oversized FFTs; the cost is
+    lowest between half the impulse response length and its length. The result is the power of two at or below
+    the impulse response length, bounded by the signal length.
+
+    Parameters
+    ----------
+    signal_length : int
+        The number of samples of the signal to convolve.
+    ir_length : int
+        The number of samples of the impulse response.
+
+    Returns
+    -------
+    int
+        The partition length in samples, a power of two of at least 64.
+    """
+    length = max(64, min(ir_length, signal_length))
+    return 1 << (length.bit_length() - 1)
+
+
+def partitioned_convolve(signal: np.ndarray, ir_spectra: np.ndarray, block_size: int) -> np.ndarray:
+    """
+    Convolve a signal with a partitioned impulse response using the uniformly partitioned overlap-add method:
+    the signal is cut into blocks of `block_size` samples, each block spectrum is multiplied with the spectrum of
+    every impulse response partition through a frequency-domain delay line, and the results are overlap-added.
+    The cost grows as O(N log B) with the block size B instead of O(N log N) for one FFT over the whole signal.
+    The spectra of the signal blocks are computed once and shared by all the channels of the impulse response,
+    a batch of blocks at a time.
+
+    Parameters
+    ----------
+    signal : np.ndarray
+        The monophonic input signal (1D).
+    ir_spectra : np.ndarray
+        The spectra of the impulse response partitions, shape (channels, partitions, block_size + 1),
+        as computed by `impulse_response_spectra`.
+    block_size : int
+        The partition length used to compute `ir_spectra`.
+
+    Returns
+    -------
+    np.ndarray
+        The first `len(signal)` samples of the convolution with every channel, shape (channels, len(signal)).
+    """
+    num_channels, num_partitions = ir_spectra.shape[:2]
+    num_blocks = max(1, -(-len(signal) // block_size))
+    padded = np.zeros(num_blocks * block_size, dtype=np.float32)
+    padded[:len(signal)] = signal
+
+    output = np.zeros((num_channels, (num_blocks + 1) * block_size), dtype=np.float32)
+
+    # The blocks are processed in batches of about CONVOLUTION_BATCH_SIZE samples, so that the spectra in flight
+    # stay small however long the signal is; the spectra of the last partitions - 1 input blocks of a batch are
+    # carried over to the next one, which still needs them in its frequency-domain delay line.
+    batch_blocks = max(1, CONVOLUTION_BATCH_SIZE // block_size)
+    history = np.zeros((0, block_size + 1), dtype=ir_spectra.dtype)
+
+    for first in range(0, num_blocks, batch_blocks):
+        last = min(first + batch_blocks, num_blocks)
+
+        # Spectra of the input blocks of the batch, transformed in one batched call, behind the carried ones
+        signal_spectra = rfft(padded[first * block_size:last * block_size].reshape(-1, block_size),
+                              n=2 * block_size, axis=1)
+        signal_spectra = np.concatenate((history, signal_spectra))
+        carried = len(history)
+
+        # Frequency-domain delay line: output block j accumulates input block j - k times partition k
+        output_spectra = np.zeros((num_channels, last - first, block_size + 1), dtype=signal_spectra.dtype)
+        for k in range(min(num_partitions, len(signal_spectra))):
+            start = max(0, k - carried)
+            output_spectra[:, start:] += (
+                signal_spectra[start + carried - k:len(signal_spectra) - k] * ir_spectra[:, k, np.newaxis, :]
+            )
+
+        # Each block yields 2 * block_size samples; the second half overlaps with the next block
+        blocks = irfft(output_spectra, n=2 * block_size, axis=2)
+        output[:, first * block_size:last * block_size] += blocks[:, :, :block_size].reshape(num_channels, -1)
+        output[:, (first + 1) * block_size:(last + 1) * block_size] += (
+            blocks[:, :, block_size:].reshape(num_channels, -1)
+        )
+
+        history = signal_spectra[max(0, len(signal_spectra) - (num_partitions - 1)):]
+
+    return output[:, :len(signal)]
+
+
+def convolve_with_impulse_response(
+        signal: np.ndarray,
+        ir: np.ndarray,
+        block_size: Optional[int] = None
+) -> np.ndarray:
     """
     Convolve the synthesized guitar tone with an impulse response, effectively simulating how the tone
     would sound in a real acoustic environment. This process emulates the effect of room acoustics,
     providing depth and spatial characteristics to the audio.
 
+    The convolution is computed with a uniformly partitioned FFT, whose impulse response spectra are cached
+    across calls with the same `ir` array and block size.
+
     Parameters
     ----------
     signal : np.ndarray
         The synthesized guitar tone, typically a 1D array representing a monophonic audio signal.
     ir : np.ndarray
         The impulse response used for convolution, which can be mono (1D) or stereo (2D).
+    block_size : int, optional
+        The partition length of the convolution in samples, chosen by `convolution_block_size` by default.
 
     Returns
     -------
     np.ndarray
         The convolved audio signal, with the characteristics of the acoustic space applied to it.
     """
+    if block_size is None:
+        block_size = convolution_block_size(len(signal), len(ir))
+
+    channels = partitioned_convolve(signal, impulse_response_spectra(ir, block_size), block_size)
 
     # Check if the impulse response is stereo (2D) or mono (1D)
     if len(ir.shape) == 2:
-        # Stereo IR: Convolve separately for each channel (left and right)
-        left_channel = fftconvolve(signal, ir[:, 0])[:len(signal)]
-        right_channel = fftconvolve(signal, ir[:, 1])[:len(signal)]
-        return np.vstack((left_channel, right_channel)).T  # Combine left and right channels
+        # Stereo IR: frames x channels, like the impulse response
+        return channels.T
     else:
-        # Mono IR: Apply convolution directly
-        return fftconvolve(signal, ir)[:len(signal)]
+        # Mono IR: a single channel
+        return channels[0]
+
+
+class StreamingConvolver:
+    """
+    Block-wise counterpart of `convolve_with_impulse_response`: a uniformly partitioned convolution that keeps its
+    frequency-domain delay line and overlap between calls, so a signal can be convolved while it is being rendered.
+    Feeding a signal in consecutive blocks of `block_size` samples yields the same result as the one-shot function.
+
+    Parameters
+    ----------
+    ir : np.ndarray
+        The impulse response used for convolution, which can be mono (1D) or stereo (2D).
+    block_size : int, optional
+        The partition length of the convolution and the length of the processed blocks, default is 4096.
+    """
+
+    def __init__(self, ir: np.ndarray, block_size: int = CONVOLUTION_BLOCK_SIZE):
+        self.block_size = block_size
+        self.is_multichannel = len(ir.shape) == 2
+        self.ir_spectra = impulse_response_spectra(ir, block_size)
+
+        # Spectra of the most recent input blocks (newest first) and the overlapping half of the last output block
+        num_channels, num_partitions, num_bins = self.ir_spectra.shape
+        self.input_spectra = np.zeros((num_partitions, num_bins), dtype=self.ir_spectra.dtype)
+        self.overlap = np.zeros((num_channels, block_size), dtype=np.float32)
+
+    def process_block(self, block: np.ndarray) -> np.ndarray:
+        """
+        Convolve the next block of the signal, a shorter final block is zero-padded.
+
+        Parameters
+        ----------
+        block : np.ndarray
+            The next block of the monophonic signal (1D), at most `block_size` samples long.
+
+        Returns
+        -------
+        np.ndarray
+            The convolved block, mono (1D) or multichannel (2D) like the impulse response, as long as `block`.
+        """
+        # Shift the frequency-domain delay line and transform the new block
+        self.input_spectra[1:] = self.input_spectra[:-1]
+        self.input_spectra[0] = rfft(block.astype(np.float32, copy=False), n=2 * self.block_size)
+
+        # Output spectrum: every stored input block times its impulse response partition
+        output_spectra = np.einsum('pk,cpk->ck', self.input_spectra, self.ir_spectra)
+        output = irfft(output_spectra, n=2 * self.block_size, axis=1)
+
+        result = output[:, :self.block_size] + self.overlap
+        self.overlap = output[:, self.block_size:]
+
+        if self.is_multichannel:
+            return result[:, :len(block)].T
+        return result[0, :len(block)]
 
 
 def concatenate_add(array1: np.ndarray, array2: np.ndarray, shifted_by: int = 0) -> np.ndarray:
     """
     Concatenate two signals, merging them with a time offset, mimicking natural delays and overlapping tones.
 
+    Renders add the tones of a string in place into a buffer sized upfront (see `synthesize_sequence`). This
+    function is kept for API compatibility and is used by `process_stroke`.
+
     Parameters
     ----------
     array1 : np.ndarray
@@ -180,6 +527,31 @@ def concatenate_add(array1: np.ndarray, array2: np.ndarray, shifted_by: int = 0)
     return extended_array1 + extended_array2
 
 
+# Sine lookup table covering one full period; the extra entry closes the period
+SINE_TABLE_SIZE = 65536
+SINE_TABLE = np.sin(np.linspace(0, 2 * np.pi, SINE_TABLE_SIZE + 1, dtype=np.float32))
+
+
+def lookup_sine(cycles: np.ndarray) -> np.ndarray:
+    """
+    Evaluate sin(2 * pi * cycles) through the precomputed sine table, replacing a libm call per sample with a
+    single table load. The phase is rounded down to the nearest of 65536 entries (an error below 1e-4).
+
+    Parameters
+    ----------
+    cycles : np.ndarray
+        Phase in cycles (turns), e.g. frequency multiplied by time.
+
+    Returns
+    -------
+    np.ndarray
+        The approximated sine of the phase.
+    """
+    indices = (cycles * SINE_TABLE_SIZE).astype(np.int64)
+    indices &= SINE_TABLE_SIZE - 1
+    return SINE_TABLE[indices]
+
+
 def fret_to_frequency(string: String, fret: int) -> float:
     """
     Calculate the fundamental frequency of a note based on the string's open frequency and fret number,
@@ -202,34 +574,35 @@ def fret_to_frequency(string: String, fret: int) -> float:
     return string.base_frequency * (2 ** (fret / 12.0))
 
 
-def modal_adjustment(harmonic: int, pluck_position: float) -> float:
+def modal_adjustment(harmonic: Union[int, np.ndarray], pluck_position: float) -> Union[float, np.ndarray]:
     """
     Compute the adjustment factor for harmonic amplitudes based on plucking position and harmonic mode,
     accounting for the influence of standing wave nodes and antinodes.
 
     Parameters
     ----------
-    harmonic : int
-        The harmonic overtone number, representing which harmonic mode is being calculated.
+    harmonic : int or np.ndarray
+        The harmonic overtone number, representing which harmonic mode is being calculated, or an array of them.
     pluck_position : float
         The relative position on the string where the pluck occurs (normalized to [0, 1]).
 
     Returns
     -------
-    float
-        The adjustment factor applied to the harmonic amplitude, attenuating harmonics when plucked near a node.
+    float or np.ndarray
+        The adjustment factor applied to the harmonic amplitude, attenuating harmonics when plucked near a node,
+        with the shape of `harmonic`.
     """
+    harmonic = np.asarray(harmonic)
 
-    # Positions of standing wave nodes.
-    node_positions = [(harmonic - 1) / (2 * harmonic) for _ in range(harmonic)]
+    # The standing wave of harmonic h has its inner nodes at k / h for k = 1 .. h - 1; only the node nearest
+    # to the pluck position matters.
+    nearest_node = np.clip(np.rint(pluck_position * harmonic), 1, harmonic - 1) / harmonic
 
-    for node in node_positions:
-        # If plucking near a node, minimal harmonic vibration occurs.
-        if abs(pluck_position - node) < 0.005:
-            return 0
+    # If plucking near a node, minimal harmonic vibration occurs (the fundamental has no inner node).
+    near_node = (harmonic > 1) & (np.abs(pluck_position - nearest_node) < 0.005)
+    adjustment = np.where(near_node, 0.0, 1.0)
 
-    # Default adjustment for harmonics if no node interference occurs.
-    return 1.0
+    return adjustment if adjustment.ndim else float(adjustment)
 
 
 def attack_curve(t, attack_duration):
@@ -250,17 +623,31 @@ def attack_curve(t, attack_duration):
         The calculated envelope curve for the attack phase.
     """
 
-    # Sigmoid curve for smoother attack.
-    sigmoid_curve = 1 / (1 + np.exp(-12 * (t / attack_duration - 1)))
+    t = np.asarray(t)
 
-    # Sinusoidal for faster attack.
-    sinusoidal_curve = np.where(t < attack_duration, np.sin(np.pi * t / (2 * attack_duration)), 1.0)
+    # Sigmoid curve for smoother attack, computed in place in a single buffer.
+    sigmoid_curve = t / attack_duration
+    sigmoid_curve -= 1
+    sigmoid_curve *= -12
+    np.exp(sigmoid_curve, out=sigmoid_curve)
+    sigmoid_curve += 1
+    np.reciprocal(sigmoid_curve, out=sigmoid_curve)
 
     # Adjust blend based on attack duration.
-    blend_factor = np.clip(attack_duration * 200, 0, 1)
+    blend_factor = float(np.clip(attack_duration * 200, 0, 1))
+    if blend_factor == 0:
+        return sigmoid_curve
+
+    # Sinusoidal for faster attack, only evaluated during the attack.
+    sinusoidal_curve = np.ones_like(sigmoid_curve)
+    attack = t < attack_duration
+    sinusoidal_curve[attack] = lookup_sine(t[attack] / (4 * attack_duration))
 
     # Blending sigmoid and sinusoidal curves.
-    return (1 - blend_factor) * sigmoid_curve + blend_factor * sinusoidal_curve
+    sigmoid_curve *= 1 - blend_factor
+    sinusoidal_curve *= blend_factor
+    sigmoid_curve += sinusoidal_curve
+    return sigmoid_curve
 
 
 def release_curve(t: np.ndarray, string: String, max_duration: float) -> np.ndarray:
@@ -282,24 +669,25 @@ def release_curve(t: np.ndarray, string: String, max_duration: float) -> np.ndar
         The computed release envelope for the note's decay phase.
     """
 
+    # Weighted sum of all decay phases, accumulated in place with a single scratch buffer.
     # Fast initial decay phase.
-    fast_decay = np.exp(-string.fast_decay_rate * t)
-
-    # Mid-level decay phase.
-    mid_decay = np.exp(-string.mid_decay_rate * t)
-
-    # Extended, slow decay.
-    very_slow_decay = np.exp(-string.very_slow_decay_rate * t)
-
-    # Weighted sum of all decay phases.
-    combined_decay = (string.fast_decay_weight * fast_decay +
-                      string.mid_decay_weight * mid_decay +
-                      string.very_slow_decay_weight * very_slow_decay)
+    combined_decay = np.multiply(-string.fast_decay_rate, t)
+    np.exp(combined_decay, out=combined_decay)
+    combined_decay *= string.fast_decay_weight
+
+    # Mid-level decay phase, then the extended, slow decay.
+    decay = np.empty_like(combined_decay)
+    for rate, weight in ((string.mid_decay_rate, string.mid_decay_weight),
+                         (string.very_slow_decay_rate, string.very_slow_decay_weight)):
+        np.multiply(-rate, t, out=decay)
+        np.exp(decay, out=decay)
+        decay *= weight
+        combined_decay += decay
 
     # Mask to limit the release curve within the maximum duration.
-    duration_mask = np.where(t < max_duration, 1, 0)
+    combined_decay *= t < max_duration
 
-    return combined_decay * duration_mask
+    return combined_decay
 
 
 def calculate_vibrato(string: String, t: np.ndarray) -> np.ndarray:
@@ -319,8 +707,74 @@ def calculate_vibrato(string: String, t: np.ndarray) -> np.ndarray:
         Vibrato modulation array, oscillating between 1 and the vibrato amplitude.
     """
 
-    # Sine wave vibrato modulation.
-    return 1 + string.vibrato_amplitude * np.sin(2 * np.pi * string.vibrato_frequency * t)
+    # Sine wave vibrato modulation, in double precision since it scales the phase of every partial.
+    vibrato = np.multiply(string.vibrato_amplitude, lookup_sine(string.vibrato_frequency * t), dtype=np.float64)
+    vibrato += 1
+    return vibrato
+
+
+# Number of samples per chunk of the harmonic synthesis, keeping the (harmonics x chunk) block cache-resident
+HARMONICS_CHUNK_SIZE = 4096
+
+
+def harmonic_profiles(bank: StringBank, pluck_position: float) -> List[Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+    """
+    Compute the per-harmonic factors of the tones of all the strings of an instrument at once, from the arrays of its
+    string bank. They only depend on the string and the pluck position, so that they can be computed once per render
+    instead of once per note.
+
+    Parameters
+    ----------
+    bank : StringBank
+        The structure-of-arrays view of the strings of the instrument (`Instrument.string_bank`).
+    pluck_position : float
+        Position on the string where it was plucked, influencing harmonic amplitudes.
+
+    Returns
+    -------
+    List[Tuple[np.ndarray, np.ndarray, np.ndarray]]
+        For every string, the frequency of every harmonic relative to the base frequency (with inharmonicity),
+        its decay rate, and its amplitude (float32) shaped by the pluck position, over the harmonics of the string.
+    """
+
+    # Harmonic orders, shared by all the strings; every string forms one row of a (strings x harmonics) block.
+    h = np.arange(1, bank.harmonics_weights.shape[1] + 1)
+
+    # Adjust for inharmonicity.
+    frequency_factors = h * (1 + bank.inharmonicity_coefficient.astype(np.float64)[:, np.newaxis] * h ** 2)
+
+    # Decay rates applied based on harmonic order.
+    decay_rates = -h / 6
+
+    # Harmonic amplitude influenced by pluck position, with modal adjustments.
+    pluck_factors = np.sin(np.pi * pluck_position * h) * modal_adjustment(h, pluck_position)
+    amplitudes = bank.harmonics_weights * pluck_factors.astype(np.float32)
+
+    # Drop the zero padding of the strings with fewer harmonics
+    return [
+        (frequency_factors[i, :count], decay_rates[:count], amplitudes[i, :count])
+        for i, count in enumerate(bank.harmonics_count.tolist())
+    ]
+
+
+def harmonic_profile(string: String, pluck_position: float) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Compute the per-harmonic factors of the tones of a single string (see `harmonic_profiles`).
+
+    Parameters
+    ----------
+    string : String
+        The guitar string object containing harmonic weights and inharmonicity factors.
+    pluck_position : float
+        Position on the string where it was plucked, influencing harmonic amplitudes.
+
+    Returns
+    -------
+    Tuple[np.ndarray, np.ndarray, np.ndarray]
+        The frequency of every harmonic relative to the base frequency (with inharmonicity), its decay rate,
+        and its amplitude (float32) shaped by the pluck position.
+    """
+    return harmonic_profiles(StringBank.from_strings([string]), pluck_position)[0]
 
 
 def calculate_harmonics(
@@ -329,7 +783,8 @@ def calculate_harmonics(
         vibrato: np.ndarray,
         pluck_position: float,
         decay_t0: float,
-        t: np.ndarray
+        t: np.ndarray,
+        profile: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]] = None
 ) -> np.ndarray:
     """
     Synthesize the harmonic components of a guitar tone, using the base frequency, string characteristics,
@@ -349,32 +804,41 @@ def calculate_harmonics(
         Time offset for the decay phase.
     t : np.ndarray
         Time array over which the harmonics are synthesized.
+    profile : Tuple[np.ndarray, np.ndarray, np.ndarray], optional
+        The harmonic factors of the string for the pluck position, as computed by `harmonic_profile`
+        (computed on the fly by default).
 
     Returns
     -------
     np.ndarray
-        The complete harmonic signal, formed by summing weighted harmonic components.
+        The complete harmonic signal (float32), formed by summing weighted harmonic components.
     """
+    if profile is None:
+        profile = harmonic_profile(string, pluck_position)
+    frequency_factors, decay_rates, amplitudes = profile
 
-    # Initialize tone as a zero array.
-    signal_tone = np.zeros_like(t)
+    # The vibrato modulates the phase of every harmonic alike.
+    harmonic_freqs = base_frequency * frequency_factors
+    modulated_t = vibrato * t
 
-    for h in range(1, len(string.harmonics_weights) + 1):
+    # The block is computed over chunks of samples small enough to stay in cache, reusing the same scratch
+    # buffers for every chunk, and each chunk is summed into the tone with a single reduction.
+    # Phases are kept in double precision (they grow to thousands of cycles), everything else is single precision.
+    signal_tone = np.empty(len(t), dtype=np.float32)
+    cycles = np.empty((len(amplitudes), min(len(t), HARMONICS_CHUNK_SIZE)))
+    partials = np.empty(cycles.shape, dtype=np.float32)
 
-        # Adjust for inharmonicity and vibrato.
-        harmonic_freq = base_frequency * (h * (1 + string.inharmonicity_coefficient * h ** 2)) * vibrato
+    for start in range(0, len(t), HARMONICS_CHUNK_SIZE):
+        stop = min(start + HARMONICS_CHUNK_SIZE, len(t))
+        chunk_cycles = cycles[:, :stop - start]
+        chunk_partials = partials[:, :stop - start]
 
-        # Decay applied based on harmonic order.
-        decay = np.exp(-h / 6 * (t - decay_t0))
+        np.multiply(harmonic_freqs[:, np.newaxis], modulated_t[start:stop], out=chunk_cycles)
+        np.multiply(decay_rates[:, np.newaxis], t[start:stop] - decay_t0, out=chunk_partials)
+        np.exp(chunk_partials, out=chunk_partials)
+        chunk_partials *= lookup_sine(chunk_cycles)
 
-        # Harmonic amplitude influenced by pluck position.
-        amplitude = string.harmonics_weights[h - 1] * np.sin(np.pi * pluck_position * h)
-
-        # Apply modal adjustments.
-        amplitude *= modal_adjustment(h, pluck_position)
-
-        # Add harmonic component to the tone.
-        signal_tone += amplitude * np.sin(2 * np.pi * harmonic_freq * t) * decay
+        np.matmul(amplitudes, chunk_partials, out=signal_tone[start:stop])
 
     return signal_tone
 
@@ -414,7 +878,54 @@ def add_attack_and_release(
     return signal_tone
 
 
-def add_white_noise(signal_tone, t, decay_t0):
+# Generator of the white noise added to the tones; replace it with a seeded one (e.g. `np.random.default_rng(0)`)
+# for reproducible renders. Renders derive one independent stream per note from it (see `note_noise_seeds`).
+noise_generator = np.random.default_rng()
+
+
+def note_noise_seeds(count: int) -> List[np.random.SeedSequence]:
+    """
+    Derive the seeds of the noise of `count` notes from `noise_generator`, in note order. Every note draws its noise
+    from its own stream, so a render seeded through `noise_generator` gives the same signal whatever the order in
+    which the notes are synthesized, e.g. by a pool of threads.
+
+    Parameters
+    ----------
+    count : int
+        The number of notes of the render.
+
+    Returns
+    -------
+    List[np.random.SeedSequence]
+        The seed of the noise generator of every note.
+    """
+    return np.random.SeedSequence(int(noise_generator.integers(2 ** 63))).spawn(count)
+
+# Level of the exponential noise envelope below which no noise is generated
+NOISE_FLOOR = 1e-5
+
+
+def noise_length(t: np.ndarray, decay_t0: float) -> int:
+    """
+    Compute the number of samples over which the white noise of a tone is audible: its envelope
+    `exp(-15 * (t - decay_t0))` falls below `NOISE_FLOOR` after less than a second.
+
+    Parameters
+    ----------
+    t : np.ndarray
+        Time array for the signal, in increasing order.
+    decay_t0 : float
+        Time offset for when the decay starts.
+
+    Returns
+    -------
+    int
+        The number of leading samples of `t` receiving noise.
+    """
+    return int(np.searchsorted(t, decay_t0 - np.log(NOISE_FLOOR) / 15))
+
+
+def add_white_noise(signal_tone, t, decay_t0, noise_envelope=None, rng=None):
     """
     Add a subtle layer of white noise to the synthesized tone,
     simulating the natural imperfections of real guitar sound.
@@ -427,6 +938,11 @@ def add_white_noise(signal_tone, t, decay_t0):
         Time array for the signal.
     decay_t0 : float
         Time offset for when the decay starts.
+    noise_envelope : np.ndarray, optional
+        A precomputed envelope attenuating the noise over time, `exp(-15 * (t - decay_t0))` by default,
+        over the `noise_length(t, decay_t0)` leading samples receiving noise.
+    rng : np.random.Generator, optional
+        The generator of the noise, `noise_generator` by default.
 
     Returns
     -------
@@ -434,13 +950,91 @@ def add_white_noise(signal_tone, t, decay_t0):
         The tone with added white noise, modulated by an envelope for realism.
     """
 
-    # Generate white noise.
-    white_noise = np.random.randn(len(t))
+    if rng is None:
+        rng = noise_generator
 
-    # Envelope to attenuate the white noise over time.
-    noise_envelope = np.exp(-15 * (t - decay_t0))
+    # Envelope to attenuate the white noise over time, only where it is above the noise floor.
+    if noise_envelope is None:
+        noise_envelope = np.exp(-15 * (t[:noise_length(t, decay_t0)] - decay_t0))
 
-    return signal_tone + 0.01 * white_noise * noise_envelope
+    # Generate white noise, in the precision of the tone, over the length of its envelope.
+    length = len(noise_envelope)
+    white_noise = rng.standard_normal(length, dtype=signal_tone.dtype)
+    white_noise *= noise_envelope
+    white_noise *= 0.01
+
+    signal_tone[:length] += white_noise
+    return signal_tone
+
+
+def tone_envelopes(
+        instrument: Instrument,
+        string_number: int,
+        duration: float,
+        decay_t0: float,
+        sr: int,
+        envelope_cache: Optional[Dict[tuple, Tuple[np.ndarray, ...]]] = None
+) -> Tuple[np.ndarray, ...]:
+    """
+    Compute the arrays of a tone that depend only on the string, the duration and the decay offset, but not on
+    the fret: the time array, the vibrato, the dynamic envelope and the noise envelope. Notes of a sheet share a
+    few durations, so most of them can reuse the arrays of an earlier note through `envelope_cache`.
+
+    Parameters
+    ----------
+    instrument : Instrument
+        The instrument object containing string properties.
+    string_number : int
+        The string number (1 to 6) of the tone.
+    duration : float
+        The duration of the tone in seconds.
+    decay_t0 : float
+        The time offset for the decay phase.
+    sr : int
+        The sample rate for the audio signal.
+    envelope_cache : dict, optional
+        A dictionary memoizing the arrays of the tones of one instrument, shared by the notes of a render.
+
+    Returns
+    -------
+    Tuple[np.ndarray, ...]
+        The time array (float64, for the phases of the partials), the vibrato (or 1 without vibrato), the dynamic
+        envelope made of the attack, the release and the dynamic range factor, and the noise envelope over its
+        audible samples (see `noise_length`) scaled by the dynamic range factor. The arrays are read-only, as they
+        may be shared.
+    """
+    key = (string_number, duration, decay_t0, sr)
+    if envelope_cache is not None and key in envelope_cache:
+        return envelope_cache[key]
+
+    # Time array, sampled at the given sample rate over the note duration. The phases of the partials need it in
+    # double precision, the envelopes are computed in single precision like the tone itself.
+    t = np.linspace(0, duration, int(sr * duration), endpoint=False)
+    envelope_t = t.astype(np.float32)
+
+    # Retrieve the specific string based on the string number, e.g., bass or treble strings
+    string = instrument.strings[string_number - 1]
+
+    # Modulate the frequency with vibrato if the instrument supports it, creating pitch oscillations
+    vibrato = calculate_vibrato(string, t) if instrument.supports_vibrato else 1
+
+    # Attack and release (decay) envelopes shaping the dynamic contour of the sound, with the dynamic range factor
+    envelope = np.full(len(t), string.dynamic_range_factor, dtype=np.float32)
+    envelope = add_attack_and_release(envelope, envelope_t, decay_t0 + 0.01, string)
+
+    # Envelope of the subtle white noise, which is applied before the dynamic range factor. Its length is found on
+    # the double precision time array, rounding the times to single precision may move the noise floor by a sample.
+    noise_envelope = np.exp(-15 * (envelope_t[:noise_length(t, decay_t0)] - decay_t0))
+    noise_envelope *= string.dynamic_range_factor
+
+    arrays = (t, vibrato, envelope, noise_envelope)
+    for array in arrays:
+        if isinstance(array, np.ndarray):
+            array.flags.writeable = False
+
+    if envelope_cache is not None:
+        envelope_cache[key] = arrays
+    return arrays
 
 
 def synthesize_tone(
@@ -450,7 +1044,10 @@ def synthesize_tone(
         duration: float = 0.1,
         pluck_position: float = 0.7,
         decay_t0: float = 0.0,
-        sr: int = 44100
+        sr: int = 44100,
+        envelope_cache: Optional[Dict[tuple, Tuple[np.ndarray, ...]]] = None,
+        profile: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]] = None,
+        rng: Optional[np.random.Generator] = None
 ) -> np.ndarray:
     """
     Synthesize a guitar tone for a specific string, fret, and duration,
@@ -473,15 +1070,25 @@ def synthesize_tone(
         The time offset for the decay phase, simulating the fading sound of a note, default is 0.0.
     sr : int, optional
         The sample rate for the audio signal, default is 44100 Hz (CD quality).
+    envelope_cache : dict, optional
+        A dictionary shared by the notes of a render, memoizing the fret-independent arrays (see `tone_envelopes`).
+    profile : Tuple[np.ndarray, np.ndarray, np.ndarray], optional
+        The harmonic factors of the string for the pluck position (see `harmonic_profiles`), shared by the notes of
+        the string in a render.
+    rng : np.random.Generator, optional
+        The generator of the noise of the tone, `noise_generator` by default.
 
     Returns
     -------
     np.ndarray
-        The synthesized tone as a NumPy array, representing the full harmonic and temporal characteristics of the note.
+        The synthesized tone as a float32 NumPy array, representing the full harmonic and temporal characteristics
+        of the note.
     """
 
-    # Time array, sampled at the given sample rate over the note duration
-    t = np.linspace(0, duration, int(sr * duration), endpoint=False)
+    # Time array, vibrato and envelopes, shared by the notes of the same string, duration and decay offset
+    t, vibrato, envelope, noise_envelope = tone_envelopes(
+        instrument, string_number, duration, decay_t0, sr, envelope_cache
+    )
 
     # Retrieve the specific string based on the string number, e.g., bass or treble strings
     string = instrument.strings[string_number - 1]
@@ -489,20 +1096,14 @@ def synthesize_tone(
     # Calculate the base frequency for the given fret using standard equal temperament tuning
     base_frequency = fret_to_frequency(string, fret)
 
-    # Modulate the frequency with vibrato if the instrument supports it, creating pitch oscillations
-    vibrato = calculate_vibrato(string, t) if instrument.supports_vibrato else 1
-
     # Compute the harmonic structure of the note, considering string inharmonicity and plucking position
-    signal_tone = calculate_harmonics(base_frequency, string, vibrato, pluck_position, decay_t0, t)
+    signal_tone = calculate_harmonics(base_frequency, string, vibrato, pluck_position, decay_t0, t, profile)
 
-    # Apply attack and release (decay) envelopes to shape the dynamic contour of the sound
-    signal_tone = add_attack_and_release(signal_tone, t, decay_t0 + 0.01, string)
+    # Apply attack and release (decay) envelopes and the dynamic range factor to shape the dynamic contour
+    signal_tone *= envelope
 
     # Add very subtle white noise for realism
-    signal_tone = add_white_noise(signal_tone, t, decay_t0)
-
-    # Apply dynamic range factor
-    signal_tone *= string.dynamic_range_factor
+    signal_tone = add_white_noise(signal_tone, t, decay_t0, noise_envelope=noise_envelope, rng=rng)
 
     return signal_tone
 
@@ -524,6 +1125,60 @@ def normalize_audio(tones: np.ndarray) -> np.ndarray:
     return tones / np.max(np.abs(tones)) * 0.95
 
 
+class StreamingNormalizer:
+    """
+    Block-wise counterpart of `normalize_audio`. The peak of the whole signal is not known while it is streamed,
+    so every block is scaled by the peak observed so far: the output never exceeds 0.95 of full scale, and once the
+    loudest passage has been reached the gain stays constant.
+    """
+
+    def __init__(self):
+        self.peak = 0.0
+
+    def process_block(self, block: np.ndarray) -> np.ndarray:
+        """
+        Normalize the next block of the signal.
+
+        Parameters
+        ----------
+        block : np.ndarray
+            The next block of the signal.
+
+        Returns
+        -------
+        np.ndarray
+            The block scaled by 0.95 over the running peak amplitude.
+        """
+        if len(block):
+            self.peak = max(self.peak, float(np.max(np.abs(block))))
+        if self.peak == 0:
+            return block
+        return block / self.peak * 0.95
+
+
+def note_decay_offsets(instrument: Instrument, stroke_time: np.ndarray) -> np.ndarray:
+    """
+    Compute the decay offsets of scheduled notes. On instruments supporting transitions (hammer on, pull off),
+    the notes following the first one of a stroke continue its decay instead of being plucked again.
+
+    Parameters
+    ----------
+    instrument : Instrument
+        The instrument object containing string and playstyle characteristics.
+    stroke_time : np.ndarray
+        The time in seconds between the start of the stroke and every note (see `NoteArrays.stroke_time`).
+
+    Returns
+    -------
+    np.ndarray
+        The decay offset (`decay_t0`) of every note.
+    """
+    if instrument.supports_transitions:
+        return 0.005 - stroke_time
+    return np.zeros(len(stroke_time))
+
+
+
 def process_stroke(
         instrument: Instrument,
         stroke: Stroke,
@@ -538,6 +1193,9 @@ def process_stroke(
     Process a single guitar stroke, generating tones for all notes in the stroke
     and updating the corresponding string buffers.
 
+    Kept for API compatibility: renders schedule all the notes of a sheet at once (see `synthesize_sequence`).
+    The stroke is laid out with `NoteArrays.schedule`, and its tones are added to the buffer of its string.
+
     Parameters
     ----------
     instrument : Instrument
@@ -565,40 +1223,27 @@ def process_stroke(
 
     assert len(stroke.frets) == len(stroke.values)
 
-    stroke_time = 0
-
-    # Iterate over all notes in the stroke (frets and note durations)
-    # Apply smooth transitions (hammer on, pull off) if the instrument supports that
-    for fret, value in zip(stroke.frets, stroke.values):
+    notes = NoteArrays.schedule([SequenceElement(strokes=[stroke])], tempo)
+    decay_offsets = note_decay_offsets(instrument, notes.stroke_time)
 
-        # Adjust duration according to the note's value and the tempo
-        duration = value.value * tempo
-
-        # Synthesize the tone for the current note, with optional letting the note ring
+    string_index = stroke.string_number - 1
+    for fret, start_time, duration, decay_t0 in zip(notes.fret, notes.start_time, notes.duration, decay_offsets):
         tone = synthesize_tone(
             instrument=instrument,
             string_number=stroke.string_number,
-            fret=capo_fret + fret,
-            duration=tempo if stroke.letRing else duration,  # Use whole note if the note should "let ring"
+            fret=capo_fret + int(fret),
+            duration=float(duration),
             pluck_position=pluck_position,
-            decay_t0=-stroke_time + 0.005 if instrument.supports_transitions else 0,
+            decay_t0=float(decay_t0),
             sr=sr
         )
 
-        # Calculate where the tone should start in the output buffer, relative to the total time
-        start_position = int((total_time + stroke_time) * sr)
-
-        # Add the new tone to the appropriate string buffer with time-shifted overlap
-        string_buffer = string_buffers[stroke.string_number - 1]
-        updated_tone = concatenate_add(string_buffer, tone, shifted_by=start_position)
-
-        # Update the buffer with the new tone
-        string_buffers[stroke.string_number - 1] = updated_tone
-
-        stroke_time += duration
+        # Add the new tone to the string buffer, relative to the total time, with time-shifted overlap
+        start_position = int((total_time + start_time) * sr)
+        string_buffers[string_index] = concatenate_add(string_buffers[string_index], tone, shifted_by=start_position)
 
     # Return the total time spent processing this stroke
-    return stroke_time
+    return sum(value.value * tempo for value in stroke.values)
 
 
 def process_sequence_element(
@@ -614,6 +1259,8 @@ def process_sequence_element(
     """
     Process a sequence element, updating string buffers with the synthesized tones for each stroke.
 
+    Kept for API compatibility, see `process_stroke`.
+
     Parameters
     ----------
     instrument : Instrument
@@ -639,8 +1286,8 @@ def process_sequence_element(
         The updated total time after processing the sequence element.
     """
 
+    # The element lasts as long as its longest stroke
     element_time = 0
-
     for stroke in element.strokes:
         stroke_time = process_stroke(
             instrument=instrument,
@@ -652,14 +1299,83 @@ def process_sequence_element(
             total_time=total_time,
             sr=sr
         )
-
-        # Track the longest stroke time
         element_time = max(element_time, stroke_time)
 
-    # Update the total time after processing the element
-    total_time += element_time
+    return total_time + element_time
 
-    return total_time
+
+def synthesize_notes(
+        instrument: Instrument,
+        notes: List[NoteEvent],
+        pluck_position: float = 0.7,
+        sr: int = 44100,
+        num_workers: Optional[int] = None
+) -> Iterator[np.ndarray]:
+    """
+    Synthesize the tones of independent notes concurrently. NumPy releases the GIL inside its array operations,
+    so the tones are rendered in parallel by a pool of threads. Notes are submitted through a window of twice the
+    number of threads, so that at most that many tones are held until they are consumed.
+
+    Parameters
+    ----------
+    instrument : Instrument
+        The instrument object, containing string and performance characteristics.
+    notes : List[NoteEvent]
+        The scheduled notes to synthesize.
+    pluck_position : float, optional
+        The position along the string where the pluck occurs, affecting harmonic structure. Default is 0.7.
+    sr : int, optional
+        The sample rate of the signal, default is 44100 Hz.
+    num_workers : int, optional
+        The number of threads synthesizing notes, default is the number of processors. Every note has its own
+        noise stream (see `note_noise_seeds`), so the result does not depend on it.
+
+    Yields
+    ------
+    np.ndarray
+        The synthesized tones, in the same order as `notes`.
+    """
+
+    # Notes of the same string, duration and decay offset share their time array and envelopes, and notes of the
+    # same string share their harmonic factors
+    envelope_cache = {}
+    profiles = harmonic_profiles(instrument.string_bank, pluck_position)
+
+    # The noise of every note comes from its own stream, independent of the thread synthesizing it
+    notes = list(notes)
+    noise_seeds = note_noise_seeds(len(notes))
+
+    def synthesize_note(note: NoteEvent, noise_seed: np.random.SeedSequence) -> np.ndarray:
+        return synthesize_tone(
+            instrument=instrument,
+            string_number=note.string_number,
+            fret=note.fret,
+            duration=note.duration,
+            pluck_position=pluck_position,
+            decay_t0=note.decay_t0,
+            sr=sr,
+            envelope_cache=envelope_cache,
+            profile=profiles[note.string_number - 1],
+            rng=np.random.default_rng(noise_seed)
+        )
+
+    # The synthesis is bound by NumPy computations, one thread per processor keeps them all busy
+    if num_workers is None:
+        num_workers = os.cpu_count() or 1
+
+    # Keep the pool busy while bounding the tones waiting to be consumed
+    with ThreadPoolExecutor(max_workers=num_workers) as executor:
+        pending = deque()
+        for note, noise_seed in zip(notes, noise_seeds):
+            pending.append(executor.submit(synthesize_note, note, noise_seed))
+            if len(pending) >= 2 * num_workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+# Size in bytes of the string buffers of a render above which they are memory-mapped to a temporary file
+MEMMAP_THRESHOLD = 1 << 28
 
 
 def synthesize_sequence(
@@ -668,7 +1384,8 @@ def synthesize_sequence(
         capo_fret: int,
         tempo: float,
         pluck_position: float = 0.7,
-        sr: int = 44100
+        sr: int = 44100,
+        num_workers: Optional[int] = None
 ) -> np.ndarray:
     """
     Synthesize the entire sequence of guitar notes into a continuous audio signal, with ringing tones for each string.
@@ -687,6 +1404,8 @@ def synthesize_sequence(
         The position along the string where the pluck occurs, affecting harmonic structure. Default is 0.7.
     sr : int
         The sample rate of the signal, default is 44100 Hz.
+    num_workers : int, optional
+        The number of threads synthesizing notes, default is the number of processors.
 
     Returns
     -------
@@ -694,34 +1413,55 @@ def synthesize_sequence(
         The final synthesized audio signal for the entire sequence.
     """
 
-    # Initialize buffers for each string (1-6) for guitars
-    string_buffers = [np.array([]) for _ in range(len(instrument.strings))]
-    total_time = 0
-
-    for element in sequence:
+    # Schedule all notes on the timeline in one pass over the flattened sequence
+    schedule = NoteArrays.schedule(sequence, tempo)
+    decay_t0 = note_decay_offsets(instrument, schedule.stroke_time)
+    notes = [
+        NoteEvent(string_number, capo_fret + fret, start_time, duration, note_decay_t0)
+        for string_number, fret, start_time, duration, note_decay_t0 in zip(
+            schedule.string_number.tolist(),
+            schedule.fret.tolist(),
+            schedule.start_time.tolist(),
+            schedule.duration.tolist(),
+            decay_t0.tolist()
+        )
+    ]
+
+    # Calculate where every tone starts and ends in the output buffer (a tone lasts `int(sr * duration)` samples)
+    start_positions = (schedule.start_time * sr).astype(np.int64).tolist()
+    end_positions = [start + int(sr * note.duration) for start, note in zip(start_positions, notes)]
+    total_length = max(end_positions, default=0)
+
+    # Preallocate the buffers for each string (1-6) for guitars over the whole sequence, as the rows of one array.
+    # Long sheets are rendered into a temporary memory-mapped file, so that the OS can page the buffers out.
+    shape = (len(instrument.strings), total_length)
+    if np.dtype(np.float32).itemsize * shape[0] * shape[1] > MEMMAP_THRESHOLD:
+        with tempfile.TemporaryFile() as buffer_file:
+            string_buffers = np.memmap(buffer_file, dtype=np.float32, mode='w+', shape=shape)
+    else:
+        string_buffers = np.zeros(shape, dtype=np.float32)
+    string_ends = [0] * len(instrument.strings)
 
-        # Ensure that buffers for each string are padded to the maximum current length
-        max_length = max(len(buffer) for buffer in string_buffers)
-        string_buffers = [np.pad(buffer, (0, max_length - len(buffer))) for buffer in string_buffers]
+    # The notes are independent of each other, so they are synthesized concurrently, and every tone is written
+    # to its string buffer as soon as it is ready
+    tones = synthesize_notes(
+        instrument=instrument,
+        notes=notes,
+        pluck_position=pluck_position,
+        sr=sr,
+        num_workers=num_workers
+    )
 
-        # Process the sequence element, updating the string buffers and total time
-        total_time = process_sequence_element(
-            instrument=instrument,
-            element=element,
-            capo_fret=capo_fret,
-            tempo=tempo,
-            pluck_position=pluck_position,
-            string_buffers=string_buffers,
-            total_time=total_time,
-            sr=sr
-        )
+    for note, tone, start_position, end_position in zip(notes, tones, start_positions, end_positions):
+        buffer = string_buffers[note.string_number - 1]
 
-    # Pad all string buffers to the length of the longest buffer
-    max_length = max(len(buffer) for buffer in string_buffers)
-    padded_buffers = [np.pad(buffer, (0, max_length - len(buffer))) for buffer in string_buffers]
+        # A new tone cuts off the tone still ringing on its string: write it in place and clear the remainder
+        buffer[start_position:end_position] = tone
+        buffer[end_position:string_ends[note.string_number - 1]] = 0
+        string_ends[note.string_number - 1] = end_position
 
-    # Sum all string buffers to create the final mixed audio signal
-    final_tone = np.sum(padded_buffers, axis=0)
+    # Sum all string buffers to create the final mixed audio signal, in a single reduction over the rows
+    final_tone = np.asarray(string_buffers).sum(axis=0)
 
     return final_tone
 
@@ -732,7 +1472,8 @@ def to_guitar_sequence(
         bpm: int = 60,
         capo_fret: int = 0,
         pluck_position: float = 0.7,
-        sr: int = 44100
+        sr: int = 44100,
+        num_workers: Optional[int] = None
 ) -> np.ndarray:
     """
     Convert a sequence of guitar strokes into a complete audio waveform, representing the entire musical passage.
@@ -752,6 +1493,8 @@ def to_guitar_sequence(
         The position along the string where the pluck occurs, affecting harmonic structure. Default is 0.7.
     sr : int, optional
         The sample rate for the audio sequence, default is 44100 Hz (CD-quality audio).
+    num_workers : int, optional
+        The number of threads synthesizing notes, default is the number of processors.
 
     Returns
     -------
@@ -765,7 +1508,8 @@ def to_guitar_sequence(
         capo_fret=capo_fret,
         tempo=tempo,
         pluck_position=pluck_position,
-        sr=sr
+        sr=sr,
+        num_workers=num_workers
     )
     audio_sequence = normalize_audio(tones)
 
@@ -781,7 +1525,8 @@ def generate_guitar_signal_from_sheet(
         impulse_response_file: Optional[str] = None,
         apply_echo: bool = True,
         echo_delay: float = 0.2,
-        echo_decay: float = 0.2
+        echo_decay: float = 0.2,
+        num_workers: Optional[int] = None
 ) -> np.ndarray:
     """
     Generate a processed guitar signal from a GuitarSheet object, with optional impulse response convolution and echo.
@@ -806,6 +1551,8 @@ def generate_guitar_signal_from_sheet(
         The delay of the echo in seconds, default is 0.2s.
     echo_decay : float, optional
         The decay factor of the echo, default is 0.2.
+    num_workers : int, optional
+        The number of threads synthesizing notes, default is the number of processors.
 
     Returns
     -------
@@ -825,7 +1572,8 @@ def generate_guitar_signal_from_sheet(
         capo_fret=capo_fret,
         bpm=bpm,
         pluck_position=pluck_position,
-        sr=sr
+        sr=sr,
+        num_workers=num_workers
     )
 
     # Convolve with impulse response if applicable
@@ -834,21 +1582,172 @@ def generate_guitar_signal_from_sheet(
 
             # Load custom impulse response if file is provided
             impulse_response = load_impulse_response(impulse_response_file)
-        elif default_impulse_response is not None:
+        elif get_default_impulse_response() is not None:
 
             # Use the default impulse response if no file is provided
-            impulse_response = default_impulse_response
+            impulse_response = get_default_impulse_response()
         else:
             raise ValueError("No impulse response file or default provided for convolution.")
 
+        # Fold the echo into the impulse response, so that a single convolution applies both effects
+        if apply_echo:
+            impulse_response = echo_impulse_response(impulse_response, delay=echo_delay, decay=echo_decay, sr=sr)
+
+            # A multichannel echo rings on after the signal, like `add_echo`
+            if len(impulse_response.shape) == 2:
+                signal = np.pad(signal, (0, int(echo_delay * sr)))
+
         # Apply convolution with the impulse response
         signal = convolve_with_impulse_response(signal, impulse_response)
 
     # Apply echo effect if applicable
-    if apply_echo:
-        signal = add_echo(signal, delay=echo_delay, decay=echo_decay)
+    elif apply_echo:
+        signal = add_echo(signal, delay=echo_delay, decay=echo_decay, sr=sr)
 
     # Normalize the audio to ensure no clipping
     signal = normalize_audio(signal)
 
     return signal
+
+
+def stream_guitar_signal_from_sheet(
+        instrument: Instrument,
+        sheet: GuitarSheet,
+        pluck_position: float = 0.7,
+        sr: int = 44100,
+        apply_convolution: bool = True,
+        impulse_response_file: Optional[str] = None,
+        apply_echo: bool = True,
+        echo_delay: float = 0.2,
+        echo_decay: float = 0.2,
+        block_size: int = CONVOLUTION_BLOCK_SIZE
+) -> Iterator[np.ndarray]:
+    """
+    Generate the processed guitar signal of a GuitarSheet block by block, as a streaming alternative to
+    `generate_guitar_signal_from_sheet`. Only the tones currently sounding (at most one per string, as a new note
+    replaces the ringing tone of its string) are kept in memory, so playback can start before rendering finishes
+    and memory does not grow with the length of the piece. Since the peak of the whole signal is not known in
+    advance, the output is normalized with a running peak (see `StreamingNormalizer`).
+
+    The signal has the length of the one-shot render: it ends with the last tone, followed by the echo tail when
+    the echo is applied to a multichannel impulse response. Like in the one-shot render, the reverberation beyond
+    that end is truncated.
+
+    Parameters
+    ----------
+    instrument : Instrument
+        The instrument object containing string properties.
+    sheet : GuitarSheet
+        The GuitarSheet object containing musical metadata such as the sequence of notes, tempo, and capo position.
+    pluck_position : float, optional
+        The pluck position on the string, affecting harmonic structure, default is 0.7.
+    sr : int, optional
+        The sample rate for the audio signal, default is 44100 Hz.
+    apply_convolution : bool, optional
+        Whether to apply impulse response convolution, default is True.
+    impulse_response_file : str, optional
+        The file path to a custom impulse response WAV file. If not provided, the default impulse response is used.
+    apply_echo : bool, optional
+        Whether to apply an echo effect, default is True.
+    echo_delay : float, optional
+        The delay of the echo in seconds, default is 0.2s.
+    echo_decay : float, optional
+        The decay factor of the echo, default is 0.2.
+    block_size : int, optional
+        The number of samples per generated block, default is 4096.
+
+    Yields
+    ------
+    np.ndarray
+        Consecutive float32 blocks of `block_size` samples (the last one may be shorter), mono (1D) or
+        multichannel (2D, frames x channels) depending on the impulse response.
+    """
+    # Dispatch the notes of the sheet in the order of their start sample, scheduled at the current tempo of the
+    # sheet like the one-shot render
+    notes = NoteArrays.schedule(sheet.sequence, tempo=60 / sheet.bpm)
+    note_starts = (notes.start_time * sr).astype(np.int64)
+    note_order = np.argsort(note_starts, kind='stable')
+    decay_t0 = note_decay_offsets(instrument, notes.stroke_time)
+
+    # The noise of every note comes from its own stream, derived in note order like in the one-shot render
+    noise_seeds = note_noise_seeds(len(notes.fret))
+
+    # Chain of block processors applied to the synthesized blocks
+    processors = []
+    if apply_convolution:
+        if impulse_response_file:
+            impulse_response = load_impulse_response(impulse_response_file)
+        elif get_default_impulse_response() is not None:
+            impulse_response = get_default_impulse_response()
+        else:
+            raise ValueError("No impulse response file or default provided for convolution.")
+        processors.append(StreamingConvolver(impulse_response, block_size))
+    if apply_echo:
+        processors.append(StreamingEcho(echo_delay, echo_decay, sr))
+    processors.append(StreamingNormalizer())
+
+    # Samples rendered after the last tone to let the echo ring on, as `generate_guitar_signal_from_sheet` does
+    tail = int(echo_delay * sr) if apply_convolution and apply_echo and len(impulse_response.shape) == 2 else 0
+
+    # Notes of the same string, duration and decay offset share their time array and envelopes, and notes of the
+    # same string share their harmonic factors
+    envelope_cache = {}
+    profiles = harmonic_profiles(instrument.string_bank, pluck_position)
+
+    # The sounding tone of every string: (start sample, tone)
+    active_tones: Dict[int, Tuple[int, np.ndarray]] = {}
+    next_note = 0
+    position = 0
+    signal_end = 0
+
+    def mix(block: np.ndarray, tone_start: int, tone: np.ndarray, until: int) -> int:
+        # Add the samples of a tone falling between the block start and `until`, return the last sample mixed
+        begin = max(position, tone_start)
+        end = min(until, tone_start + len(tone))
+        if end > begin:
+            block[begin - position:end - position] += tone[begin - tone_start:end - tone_start]
+        return end
+
+    while next_note < len(note_order) or active_tones or position < signal_end + tail:
+        block = np.zeros(block_size, dtype=np.float32)
+        block_end = position + block_size
+
+        # Start the notes beginning within this block, cutting off the tone previously ringing on their string
+        while next_note < len(note_order) and note_starts[note_order[next_note]] < block_end:
+            i = note_order[next_note]
+            string_number = int(notes.string_number[i])
+            start = int(note_starts[i])
+            if string_number in active_tones:
+                signal_end = max(signal_end, mix(block, *active_tones[string_number], until=start))
+
+            tone = synthesize_tone(
+                instrument=instrument,
+                string_number=string_number,
+                fret=sheet.capo_fret + int(notes.fret[i]),
+                duration=float(notes.duration[i]),
+                pluck_position=pluck_position,
+                decay_t0=float(decay_t0[i]),
+                sr=sr,
+                envelope_cache=envelope_cache,
+                profile=profiles[string_number - 1],
+                rng=np.random.default_rng(noise_seeds[i])
+            )
+            active_tones[string_number] = (start, tone)
+            next_note += 1
+
+        # Mix the sounding tones into the block, releasing those that have ended
+        for string_number, (tone_start, tone) in list(active_tones.items()):
+            signal_end = max(signal_end, mix(block, tone_start, tone, until=block_end))
+            if tone_start + len(tone) <= block_end:
+                del active_tones[string_number]
+
+        # The last block ends with the last tone, or with the echo tail following it
+        if next_note == len(note_order) and not active_tones:
+            block = block[:max(0, signal_end + tail - position)]
+        position = block_end
+
+        for processor in processors:
+            block = processor.process_block(block)
+
+        if len(block):
+            yield block.astype(np.float32)
@@ -20,7 +20,10 @@ Author
     Email: mustafa.alotbah@gmail.com
 """
 from .types import Stroke, NoteValue, SequenceElement, GuitarSheet
-from typing import List, Dict
+from typing import Iterable, Iterator, List, TextIO, Tuple, Union
+import numpy as np
+import bisect
+import os
 import re
 
 # String-to-number mapping for guitar strings (standard tuning)
@@ -53,17 +56,91 @@ letter_to_fret = {
     'f': 15
 }
 
+# Character classes of the tab bytes (tab lines are scanned as ASCII bytes), as bit flags
+DIGIT_CLASS = 1
+LETTER_CLASS = 2
+SYMBOL_CLASS = 4
+RING_CLASS = 8
+DASH_CLASS = 16
+FRET_CLASS = DIGIT_CLASS | LETTER_CLASS
 
-def parse_fret_with_symbol(fret: str, symbol: str) -> (int, NoteValue):
+
+def build_character_tables() -> (bytearray, List[int]):
+    """
+    Build the lookup tables of the tab bytes, replacing the character tests of the column scan by indexing.
+
+    Returns
+    -------
+    bytearray
+        The class flags of every byte (0 for bytes without a meaning in a tab line).
+    List[int]
+        The fret number of every fret byte (digits 0-9 and letters a-f), 0 for any other byte.
+    """
+    character_class = bytearray(256)
+    fret_value = [0] * 256
+
+    for byte in b'0123456789':
+        character_class[byte] = DIGIT_CLASS
+        fret_value[byte] = byte - ord('0')
+    for letter, fret in letter_to_fret.items():
+        character_class[ord(letter)] = LETTER_CLASS
+        fret_value[ord(letter)] = fret
+    for byte in b'+!':
+        character_class[byte] = SYMBOL_CLASS
+    character_class[ord('r')] = RING_CLASS
+    character_class[ord('-')] = DASH_CLASS
+
+    return character_class, fret_value
+
+
+character_class_table, fret_value_table = build_character_tables()
+
+# String number of every first byte of a tab line, 0 for bytes that do not name a string
+string_number_table = bytes(string_to_number.get(chr(byte), 0) for byte in range(256))
+
+# Whether every byte is a fret or a symbol, the only bytes of the columns holding notes, indexed by a grid of tab bytes
+note_byte_table = np.array(
+    [bool(character_class_table[byte] & (FRET_CLASS | SYMBOL_CLASS)) for byte in range(256)], dtype=bool
+)
+
+# Codes of the duration symbols, indexing `note_value_by_symbol_code`; any other run of symbol bytes gets the last
+# code, an eighth note like the frets of a group
+symbol_codes = tuple(symbol_to_note_value)
+INVALID_SYMBOL_CODE = len(symbol_codes)
+note_value_by_symbol_code = tuple(symbol_to_note_value.values()) + (NoteValue.eighthNote,)
+
+# Code of the symbol extended by one more symbol byte: symbol_code_transitions[byte][code]
+symbol_code_transitions = {
+    ord(character): tuple(
+        symbol_codes.index(symbol + character) if symbol + character in symbol_codes else INVALID_SYMBOL_CODE
+        for symbol in symbol_codes
+    ) + (INVALID_SYMBOL_CODE,)
+    for character in '+!'
+}
+
+# Compiled pattern of the metadata lines of a tab sheet (title, author, bpm, and capo fret), capturing the field
+# and the value following its colon, if any
+metadata_line_pattern = re.compile(r'\s*(title|author|bpm|capo\s*fret)\s*(?::\s*(.*))?', re.IGNORECASE)
+number_pattern = re.compile(r'\d+')
+
+# Lowercase prefixes of the metadata lines, tested before the pattern to leave the tab lines out of the regex engine
+metadata_prefixes = ('title', 'author', 'bpm', 'capo')
+
+
+def parse_fret_with_symbol(fret: int, symbol_code: int, _fret_value_table=fret_value_table,
+                           _note_value_by_symbol_code=note_value_by_symbol_code) -> (int, NoteValue):
     """
     Parse a fret and its associated symbol to return the fret number and corresponding note value.
 
     Parameters
     ----------
-    fret : str
-        The fret number as a string (can be a number or letter).
-    symbol : str
-        The symbol associated with the fret for note duration (e.g., '!', '++').
+    fret : int
+        The byte of the fret in the tab line (a digit or a letter).
+    symbol_code : int
+        The code of the symbol associated with the fret for note duration (e.g., '!', '++'),
+        an index into `symbol_codes`.
+
+    The underscored parameters bind the module tables as local variables and are not meant to be passed.
 
     Returns
     -------
@@ -73,63 +150,69 @@ def parse_fret_with_symbol(fret: str, symbol: str) -> (int, NoteValue):
         The corresponding note value.
     """
 
-    fret_number = 0
-    if fret.isdigit():
-        fret_number = int(fret)
-    elif fret in letter_to_fret:
-        fret_number = letter_to_fret.get(fret, 0)
+    fret_number = _fret_value_table[fret]
 
-    note_value = symbol_to_note_value.get(symbol, NoteValue.eighthNote)  # Default to eighth note for grouped frets
+    note_value = _note_value_by_symbol_code[symbol_code]  # Default to eighth note for grouped frets
     return fret_number, note_value
 
 
-def extract_frets_and_symbols(line: str, i: int, num_positions: int) -> (str, str, int):
+def extract_frets_and_symbols(line: bytes, i: int, num_positions: int, _character_class_table=character_class_table,
+                              _symbol_code_transitions=symbol_code_transitions) -> (int, int, int):
     """
     Extract the fret and symbol for note duration from the given tab line.
 
     Parameters
     ----------
-    line : str
-        The string's tab line.
+    line : bytes
+        The string's tab line, as ASCII bytes.
     i : int
         The current position (column) in the tab.
     num_positions : int
         The total number of positions in the tab.
 
+    The underscored parameters bind the module tables as local variables and are not meant to be passed.
+
     Returns
     -------
-    str
-        The fret number as a string.
-    str
-        The symbol associated with the fret (e.g., '!', '++').
+    int
+        The byte of the fret.
+    int
+        The code of the symbol associated with the fret (e.g., '!', '++').
     int
         The index of the next non-fret character.
     """
     fret = line[i]
-    symbol = ""
+
+    symbol_code = 0
 
     # Look ahead to capture symbols like '+', '!', etc.
     next_idx = i + 1
-    while next_idx < num_positions and (line[next_idx] in ['+', '!']):
-        symbol += line[next_idx]
+    while next_idx < num_positions and _character_class_table[line[next_idx]] & SYMBOL_CLASS:
+        symbol_code = _symbol_code_transitions[line[next_idx]][symbol_code]
         next_idx += 1
 
-    return fret, symbol, next_idx
+    return fret, symbol_code, next_idx
 
 
-def process_frets_in_column(tab_lines: Dict[int, str], i: int, num_positions: int) -> (List[Stroke], int):
+def process_frets_in_column(tab_lines: List[Tuple[int, bytes]], i: int, num_positions: int,
+                            _character_class_table=character_class_table,
+                            _extract_frets_and_symbols=extract_frets_and_symbols,
+                            _parse_fret_with_symbol=parse_fret_with_symbol,
+                            _stroke=Stroke) -> (List[Stroke], int):
     """
     Process a single vertical slice of the tab (a column) and return the strokes and how much to advance the index.
 
     Parameters
     ----------
-    tab_lines : Dict[int, str]
-        The dictionary mapping string numbers to their tab content.
+    tab_lines : List[Tuple[int, bytes]]
+        The string numbers and their tab content, as ASCII bytes.
     i : int
         The current position (column) in the tab.
     num_positions : int
         The number of positions (columns) in the tab.
 
+    The underscored parameters bind the module tables and functions as local variables and are not meant to be passed.
+
     Returns
     -------
     List[Stroke]
@@ -140,46 +223,49 @@ def process_frets_in_column(tab_lines: Dict[int, str], i: int, num_positions: in
     strokes = []
     max_fret_span = 1
     let_ring = False  # Default is False
+    note_class = FRET_CLASS | SYMBOL_CLASS
 
-    # Check if the column ends with 'r' to indicate the letRing parameter
-    for string_number, line in tab_lines.items():
-        next_idx = i
-        while next_idx < num_positions and line[next_idx] != '-':
-            if line[next_idx] == 'r':
-                # Set let_ring to True if 'r' is found
-                let_ring = True
-                break
-            next_idx += 1
-
-        # Exit early if 'r' is found in any string
-        if let_ring:
-            break
-
-    for string_number, line in tab_lines.items():
+    for string_number, line in tab_lines:
         # Check if the index exists
         if i < len(line):
-            frets = []
-            values = []
             next_idx = i
 
-            # Handle consecutive frets and symbols within a single stroke
-            while next_idx < num_positions and (
-                    line[next_idx].isdigit() or
-                    line[next_idx] in letter_to_fret or
-                    line[next_idx] in ['+', '!']
-            ):
-                if line[next_idx].isdigit() or line[next_idx] in letter_to_fret:
-                    fret, symbol, next_idx = extract_frets_and_symbols(line, next_idx, num_positions)
-                    fret_number, note_value = parse_fret_with_symbol(fret, symbol)
-                    frets.append(fret_number)
-                    values.append(note_value)
-
-            # If we gathered any frets, create a stroke for them
-            if frets:
-                strokes.append(Stroke(string_number=string_number, frets=frets, values=values, letRing=let_ring))
+            # Handle consecutive frets and symbols within a single stroke, the lists of the stroke being only
+            # created for the strings holding a note in this column
+            if _character_class_table[line[next_idx]] & note_class:
+                frets = bytearray()
+                values = []
+                while next_idx < num_positions and _character_class_table[line[next_idx]] & note_class:
+                    if _character_class_table[line[next_idx]] & FRET_CLASS:
+                        fret, symbol_code, next_idx = _extract_frets_and_symbols(line, next_idx, num_positions)
+                        fret_number, note_value = _parse_fret_with_symbol(fret, symbol_code)
+                        frets.append(fret_number)
+                        values.append(note_value)
+                    else:
+                        # Skip a symbol not following a fret
+                        next_idx += 1
+
+                # If we gathered any frets, keep them for a stroke
+                if frets:
+                    strokes.append((string_number, frets, values))
 
             # Update max_fret_span to the number of characters processed
-            max_fret_span = max(max_fret_span, next_idx - i)
+            if (fret_span := next_idx - i) > max_fret_span:
+                max_fret_span = fret_span
+
+            # Check if the column ends with 'r' to indicate the letRing parameter, continuing the scan of the
+            # line from the end of its frets up to the next dash
+            ring_idx = next_idx
+            while not let_ring and ring_idx < num_positions and not _character_class_table[line[ring_idx]] & DASH_CLASS:
+                # Set let_ring to True if 'r' is found
+                let_ring = bool(_character_class_table[line[ring_idx]] & RING_CLASS)
+                ring_idx += 1
+
+    # The letRing parameter applies to all the strokes of the column
+    strokes = [
+        _stroke(string_number=string_number, frets=frets, values=values, letRing=let_ring)
+        for string_number, frets, values in strokes
+    ]
 
     return strokes, max_fret_span
 
@@ -188,6 +274,8 @@ def advance_index(i: int, max_fret_span: int) -> int:
     """
     Advance the index by the number of positions based on the maximum fret span.
 
+    Kept for backwards compatibility, the tab parsing loop advances its index inline.
+
     Parameters
     ----------
     i : int
@@ -204,34 +292,43 @@ def advance_index(i: int, max_fret_span: int) -> int:
     return i + max_fret_span
 
 
-def parse_guitar_tab(tab: str) -> List[SequenceElement]:
+def parse_guitar_tab(tab: Union[str, List[str]]) -> List[SequenceElement]:
     """
     Parse a guitar tab string into a list of SequenceElement objects.
 
     Parameters
     ----------
-    tab : str
-        A string representing guitar tab lines.
+    tab : str or List[str]
+        A string representing guitar tab lines, or the list of these lines.
 
     Returns
     -------
     List[SequenceElement]
         A list of SequenceElement objects representing the parsed strokes.
     """
-    lines = tab.strip().splitlines()
+    lines = tab.strip().splitlines() if isinstance(tab, str) else tab
 
     # Parse the lines into a dictionary mapping string numbers to tab content
     tab_lines = parse_lines_to_tab_lines(lines)
 
     # Get the number of positions (columns) in the tab
-    num_positions = len(next(iter(tab_lines.values())))
+    num_positions = len(tab_lines[0][1])
 
     # Initialize list to hold the parsed strokes
     sequence = []
 
-    # Iterate through each vertical slice of the tab (each column)
+    # Iterate through each vertical slice of the tab (each column), skipping the columns without notes, which
+    # would only advance the index by one
+    note_columns = find_note_columns(tab_lines, num_positions)
+    next_column = 0
+
     i = 0
-    while i < num_positions:
+    while True:
+        next_column = bisect.bisect_left(note_columns, i, next_column)
+        if next_column == len(note_columns):
+            break
+        i = note_columns[next_column]
+
         # Process each column and get the strokes and how far to advance
         strokes, max_fret_span = process_frets_in_column(tab_lines, i, num_positions)
 
@@ -239,13 +336,37 @@ def parse_guitar_tab(tab: str) -> List[SequenceElement]:
         if strokes:
             sequence.append(SequenceElement(strokes=strokes))
 
-        # Advance the index
-        i = advance_index(i, max_fret_span)
+        # Advance the index by the number of columns processed (the addition of `advance_index`, inlined)
+        i += max_fret_span
 
     return sequence
 
 
-def parse_lines_to_tab_lines(lines: List[str]) -> Dict[int, str]:
+def find_note_columns(tab_lines: List[Tuple[int, bytes]], num_positions: int) -> List[int]:
+    """
+    Find the columns of the tab holding a fret or a duration symbol on any string. The lines are stacked into
+    a grid of bytes (padded with dashes to the number of positions) classified at once, the other columns, only
+    made of dashes, bars and other separators, holding no stroke.
+
+    Parameters
+    ----------
+    tab_lines : List[Tuple[int, bytes]]
+        The string numbers and their tab content, as ASCII bytes.
+    num_positions : int
+        The number of positions (columns) in the tab.
+
+    Returns
+    -------
+    List[int]
+        The sorted columns holding notes.
+    """
+    grid = np.frombuffer(
+        b''.join(line[:num_positions].ljust(num_positions, b'-') for _, line in tab_lines), dtype=np.uint8
+    ).reshape(len(tab_lines), num_positions)
+    return np.flatnonzero(note_byte_table[grid].any(axis=0)).tolist()
+
+
+def parse_lines_to_tab_lines(lines: List[str]) -> List[Tuple[int, bytes]]:
     """
     Parse the tab lines and map each string line to its corresponding string number.
 
@@ -253,86 +374,160 @@ def parse_lines_to_tab_lines(lines: List[str]) -> Dict[int, str]:
     - lines (List[str]): The list of tab lines.
 
     Returns:
-    - Dict[int, str]: A dictionary mapping string numbers to their tab content.
+    - List[Tuple[int, bytes]]: The string numbers and their tab content, encoded as ASCII bytes (any other
+      character is replaced by '?', keeping the columns aligned). A string given twice keeps its latest line.
     """
     tab_lines = {}
     for line in lines:
-        line = line.strip()  # Remove leading/trailing spaces
-        if not line or line[0] not in string_to_number:  # Skip invalid lines
+        line = line.lstrip()  # Remove leading spaces
+        # String number from the first character, checked before copying the rest of the line
+        string_number = string_number_table[ord(line[0])] if line and line[0] < '\x80' else 0
+        if not string_number:  # Skip invalid lines
             continue
-        string_number = string_to_number[line[0]]  # Get string number from the first character
-        tab_lines[string_number] = line[2:]  # The actual tab content starts from index 2
-    return tab_lines
+        # The actual tab content starts from index 2
+        tab_lines[string_number] = line[2:].rstrip().encode('ascii', 'replace')
+    return list(tab_lines.items())
 
 
-def parse_guitar_tab_from_file(file_path: str) -> GuitarSheet:
+def iter_tab_sections(lines: Iterable[str], metadata: dict) -> Iterator[List[str]]:
     """
-    Read a guitar tab from a file, process multiple sections separated by blank lines,
-    and parse each section into a list of SequenceElement objects. The function will ignore
-    metadata such as title, author, BPM, and capo fret.
+    Split the lines of a guitar tab file into its sections, separated by blank lines, in a single pass.
+    Metadata lines are collected into `metadata` instead of being yielded, comment lines starting with #
+    are dropped, and sections without any content are skipped.
+
+    Parameters
+    ----------
+    lines : Iterable[str]
+        The lines of the guitar tab, including its metadata, with or without their line endings.
+    metadata : dict
+        The metadata fields found so far (title, author, bpm, and capo fret), completed in place with the
+        first occurrence of every field.
+
+    Yields
+    ------
+    List[str]
+        The lines of every section, ready to be parsed by `parse_guitar_tab`.
+    """
+    section = []
+    has_content = False
+
+    for line in lines:
+        line = line.rstrip('\r\n')
+
+        # Extract the metadata and remove its lines before processing the tab content
+        metadata_match = line.lstrip()[:6].lower().startswith(metadata_prefixes) and metadata_line_pattern.match(line)
+        if metadata_match:
+            if metadata_match.group(2) is not None:
+                metadata.setdefault(''.join(metadata_match.group(1).lower().split()), metadata_match.group(2))
+            continue
+
+        # Sections are separated by blank lines
+        if not line:
+            if has_content:
+                yield section
+            section = []
+            has_content = False
+            continue
+
+        # Remove comment lines starting with #
+        stripped = line.strip()
+        if not stripped.startswith('#'):
+            section.append(line)
+            has_content = has_content or bool(stripped)
+
+    if has_content:
+        yield section
+
+
+def parse_guitar_tab_from_lines(lines: Iterable[str]) -> GuitarSheet:
+    """
+    Parse the lines of a guitar tab file, made of multiple sections separated by blank lines,
+    into a GuitarSheet. Metadata lines such as title, author, BPM, and capo fret are extracted
+    and excluded from the tab sections, and comment lines starting with # are skipped.
+
+    The lines are consumed in a single pass, so it can read a file line by line
+    without holding its whole content.
 
     Parameters
     ----------
-    file_path : str
-        The path to the file containing the guitar tab.
+    lines : Iterable[str]
+        The lines of the guitar tab, including its metadata, with or without their line endings.
 
     Returns
     -------
     GuitarSheet
         A GuitarSheet object representing the parsed strokes, with default BPM and capo fret values.
     """
-    with open(file_path, 'r') as file:
-        tab_content = file.read()
-
     # Initialize bpm and capo_fret
     bpm = 60
     capo_fret = 0
     title = "Unknown Title"
     author = "Unknown Author"
 
-    # Check for bpm and capo fret in the tab content using regex
-    bpm_match = re.search(r'bpm\s*:\s*(\d+)', tab_content, re.IGNORECASE)
-    capo_match = re.search(r'capo\s*fret\s*:\s*(\d+)', tab_content, re.IGNORECASE)
-    title_match = re.search(r'title\s*:\s*(.*)', tab_content, re.IGNORECASE)
-    author_match = re.search(r'author\s*:\s*(.*)', tab_content, re.IGNORECASE)
+    # The metadata (title, author, bpm, and capo fret); the first occurrence of every field is used
+    metadata = {}
+
+    # Accumulate the parsed sequences of all the sections
+    final_sequence = []
+    for section in iter_tab_sections(lines, metadata):
+        final_sequence.extend(parse_guitar_tab(section))
+
+    bpm_match = number_pattern.match(metadata.get('bpm', ''))
+    capo_match = number_pattern.match(metadata.get('capofret', ''))
 
     if bpm_match:
-        bpm = int(bpm_match.group(1))
+        bpm = int(bpm_match.group())
 
     if capo_match:
-        capo_fret = int(capo_match.group(1))
+        capo_fret = int(capo_match.group())
 
-    if title_match:
-        title = title_match.group(1).strip()
+    if 'title' in metadata:
+        title = metadata['title'].strip()
 
-    if author_match:
-        author = author_match.group(1).strip()
+    if 'author' in metadata:
+        author = metadata['author'].strip()
 
-    # Remove metadata lines (title, author, bpm, and capo fret) before processing the tab content
-    cleaned_tab_content = "\n".join(
-        line for line in tab_content.splitlines()
-        if not re.match(r'(title|author|bpm|capo\s*fret)\s*', line, re.IGNORECASE)
-    )
+    # Return a GuitarSheet object with the parsed sequence, bpm, and capo fret
+    return GuitarSheet(title=title, author=author, sequence=final_sequence, bpm=bpm, capo_fret=capo_fret)
 
-    # Split the cleaned content into sections by blank lines (one or more newlines)
-    sections = cleaned_tab_content.strip().split('\n\n')
 
-    # Initialize the final sequence that will accumulate all parsed sequences
-    final_sequence = []
+def parse_guitar_tab_from_string(tab_content: str) -> GuitarSheet:
+    """
+    Parse the content of a guitar tab file, made of multiple sections separated by blank lines,
+    into a GuitarSheet. Metadata lines such as title, author, BPM, and capo fret are extracted
+    and excluded from the tab sections.
 
-    # Process each section of the tab
-    for section in sections:
-        if section.strip():  # Ignore empty sections
-            # Remove comment lines starting with #
-            lines = section.splitlines()
-            non_comment_lines = [line for line in lines if not line.strip().startswith('#')]
+    Parameters
+    ----------
+    tab_content : str
+        The full content of the guitar tab, including its metadata.
 
-            # Join the filtered lines back into a section
-            non_comment_section = "\n".join(non_comment_lines)
+    Returns
+    -------
+    GuitarSheet
+        A GuitarSheet object representing the parsed strokes, with default BPM and capo fret values.
+    """
+    return parse_guitar_tab_from_lines(tab_content.splitlines())
 
-            if non_comment_section.strip():  # If the section has valid content
-                section_sequence = parse_guitar_tab(non_comment_section)
-                final_sequence.extend(section_sequence)
 
-    # Return a GuitarSheet object with the parsed sequence, bpm, and capo fret
-    return GuitarSheet(title=title, author=author, sequence=final_sequence, bpm=bpm, capo_fret=capo_fret)
+def parse_guitar_tab_from_file(file_path: Union[str, os.PathLike, TextIO]) -> GuitarSheet:
+    """
+    Read a guitar tab from a file, process multiple sections separated by blank lines,
+    and parse each section into a list of SequenceElement objects. The function will ignore
+    metadata such as title, author, BPM, and capo fret. The file is read line by line.
+
+    Parameters
+    ----------
+    file_path : str, os.PathLike or TextIO
+        The path to the file containing the guitar tab, or an open text file holding it.
+
+    Returns
+    -------
+    GuitarSheet
+        A GuitarSheet object representing the parsed strokes, with default BPM and capo fret values.
+    """
+    if hasattr(file_path, 'read'):
+        return parse_guitar_tab_from_lines(file_path)
+
+    with open(file_path, 'r') as file:
+        return parse_guitar_tab_from_lines(file)
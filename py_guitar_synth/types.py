@@ -12,7 +12,8 @@ Script Purpose
 --------------
     This module defines the core types used across the project, such as note values, transitions, and guitar strokes.
     It provides data structures like `GuitarSheet`, `SequenceElement`, and `Instrument`, which form the foundation for
-    parsing and synthesizing guitar performances.
+    parsing and synthesizing guitar performances, as well as `StringBank`, an array-per-property view of an
+    instrument's strings suited for vectorized synthesis.
 
 Author
 ------
@@ -20,14 +21,21 @@ Author
     Email: mustafa.alotbah@gmail.com
 """
 
+import numbers
+import sys
+import numpy as np
 from enum import Enum
-from dataclasses import dataclass
-from typing import List, Optional
+from dataclasses import dataclass, field, fields
+from typing import List, Optional, Tuple
 
+# Keyword arguments of `dataclass` dropping the per-instance `__dict__`, supported from Python 3.10
+SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
 
-class NoteValue(Enum):
+
+class NoteValue(float, Enum):
     """
     Enumeration of rhythmic note values, quantifying the temporal length of musical notes in relative proportions.
+    The members are floats, so durations are computed from them directly.
 
     Attributes
     ----------
@@ -52,7 +60,7 @@ class NoteValue(Enum):
     sixteenthNote = 0.0625
 
 
-class TransitionType(Enum):
+class TransitionType(int, Enum):
     """
     Enumeration of articulatory transitions between musical notes on the guitar, defining distinct legato and staccato techniques.
 
@@ -70,7 +78,7 @@ class TransitionType(Enum):
     slide = 2
 
 
-class PluckStyle(Enum):
+class PluckStyle(int, Enum):
     """
     Enumeration of tonal variations in plucking dynamics, influencing timbral intensity and articulation.
     TODO unused
@@ -86,7 +94,7 @@ class PluckStyle(Enum):
     soft = 1
 
 
-class PlayStyle(Enum):
+class PlayStyle(int, Enum):
     """
     Enumeration of advanced playing techniques, modulating pitch, tone, and articulation through expressive means.
     TODO unused
@@ -105,7 +113,7 @@ class PlayStyle(Enum):
     tremelo = 2
 
 
-@dataclass
+@dataclass(**SLOTS)
 class Stroke:
     """
     Data structure representing a guitar stroke, encompassing multiple notes
@@ -115,8 +123,10 @@ class Stroke:
     ----------
     string_number : int
         The index of the guitar string being struck, where 1 represents the lowest string (1 to 6).
-    frets : List[int]
-        A sequence of frets engaged during the stroke, defining the pitch of each note.
+    frets : bytes
+        A sequence of frets engaged during the stroke, defining the pitch of each note, one byte per fret
+        (any sequence of fret numbers, such as a list of ints, is converted). Iterating over it gives the
+        fret numbers as integers.
     values : List[NoteValue]
         Rhythmic durations corresponding to each note in the stroke.
     transition_types : Optional[List[TransitionType]], optional
@@ -125,13 +135,28 @@ class Stroke:
         Boolean flag indicating whether the notes should sustain (let ring) beyond their nominal value.
     """
     string_number: int  # 1..6
-    frets: List[int]  # 0..16
+    frets: bytes  # 0..15
     values: List[NoteValue]
     transition_types: Optional[List[TransitionType]] = None
     letRing: bool = False
 
+    def __post_init__(self):
+        if isinstance(self.frets, (bytes, bytearray)):
+            self.frets = bytes(self.frets)
+            return
 
-@dataclass
+        # bytes() would turn a single int into that many zero frets, and copy the raw buffer of a NumPy array
+        if isinstance(self.frets, (numbers.Integral, str)):
+            raise TypeError(f"frets must be a sequence of fret numbers, got {self.frets!r}")
+        try:
+            self.frets = bytes(list(self.frets))
+        except TypeError:
+            raise TypeError(f"frets must be a sequence of fret numbers, got {self.frets!r}") from None
+        except ValueError:
+            raise ValueError(f"frets must be between 0 and 255, got {self.frets!r}") from None
+
+
+@dataclass(**SLOTS)
 class SequenceElement:
     """
     Represents a single sequence element in a guitar performance, aggregating strokes into a coherent musical phrase.
@@ -144,7 +169,129 @@ class SequenceElement:
     strokes: List[Stroke]
 
 
+@dataclass(**SLOTS)
+class NoteEvent:
+    """
+    A single note placed on the timeline of a performance, ready to be synthesized independently of the others.
+
+    Attributes
+    ----------
+    string_number : int
+        The index of the guitar string the note is played on (1 to 6).
+    fret : int
+        The fret sounding the note, including the capo offset.
+    start_time : float
+        The time in seconds at which the note starts.
+    duration : float
+        The duration in seconds of the synthesized tone (longer than the nominal value if the note rings).
+    decay_t0 : float
+        The time offset of the decay phase, non-zero for notes reached through a transition.
+    """
+    string_number: int
+    fret: int
+    start_time: float
+    duration: float
+    decay_t0: float
+
+
 @dataclass
+class NoteArrays:
+    """
+    Structure-of-arrays representation of all the notes of a sheet, laid out on the timeline of the performance,
+    so that synthesis can dispatch notes from a few arrays instead of walking the nested sequence of strokes.
+
+    Attributes
+    ----------
+    string_number : np.ndarray
+        The guitar string of every note (1 to 6).
+    fret : np.ndarray
+        The fret of every note, without the capo offset.
+    start_time : np.ndarray
+        The time in seconds at which every note starts.
+    duration : np.ndarray
+        The time in seconds every note sounds (a whole beat for notes that are let ring).
+    stroke_time : np.ndarray
+        The time in seconds between the start of the stroke and the note, non-zero for notes reached through
+        a transition within the stroke.
+
+    Notes are ordered as in the sequence: by element, then by stroke, then by position within the stroke.
+    """
+    string_number: np.ndarray
+    fret: np.ndarray
+    start_time: np.ndarray
+    duration: np.ndarray
+    stroke_time: np.ndarray
+
+    @classmethod
+    def from_sequence(cls, sequence: List[SequenceElement], bpm: int) -> 'NoteArrays':
+        """
+        Lay out the notes of a sequence on the timeline, with the same timing as the sequential synthesis.
+
+        Parameters
+        ----------
+        sequence : List[SequenceElement]
+            The sequence of musical elements of the sheet.
+        bpm : int
+            The tempo of the performance in beats per minute.
+
+        Returns
+        -------
+        NoteArrays
+            The structure-of-arrays view of the notes.
+        """
+        return cls.schedule(sequence, tempo=60 / bpm)
+
+    @classmethod
+    def schedule(cls, sequence: List[SequenceElement], tempo: float) -> 'NoteArrays':
+        """
+        Lay out the notes of a sequence on the timeline for a tempo multiplier. The nested sequence is flattened
+        in a single pass, and the timing is computed on whole arrays: the time of every note within its stroke,
+        the length of every element (its longest stroke), and the start of every element.
+
+        Parameters
+        ----------
+        sequence : List[SequenceElement]
+            The sequence of musical elements of the sheet.
+        tempo : float
+            The duration in seconds of a whole note value.
+
+        Returns
+        -------
+        NoteArrays
+            The structure-of-arrays view of the notes.
+        """
+        strokes = [(index, stroke) for index, element in enumerate(sequence) for stroke in element.strokes]
+        stroke_lengths = np.array([len(stroke.frets) for _, stroke in strokes], dtype=np.int64)
+        stroke_element = np.array([index for index, _ in strokes], dtype=np.int64)
+
+        # Note values of every stroke as the rows of a zero-padded matrix, behind a leading column of zeros,
+        # so that the row-wise running sum gives the time of every note within its stroke and the stroke length
+        max_length = int(stroke_lengths.max(initial=0))
+        values = np.zeros((len(strokes), max_length + 1))
+        in_stroke = np.arange(max_length) < stroke_lengths[:, None]
+        values[:, 1:][in_stroke] = [value * tempo for _, stroke in strokes for value in stroke.values]
+        times = np.cumsum(values, axis=1)
+
+        # Every element lasts as long as its longest stroke, and starts where the previous element ends
+        element_time = np.zeros(len(sequence))
+        np.maximum.at(element_time, stroke_element, times[np.arange(len(strokes)), stroke_lengths])
+        element_start = np.cumsum(np.concatenate(([0.0], element_time)))[:-1]
+
+        # Notes ringing on after their value sound for a whole note value
+        let_ring = np.repeat([stroke.letRing for _, stroke in strokes], stroke_lengths).astype(bool)
+        stroke_time = times[:, :-1][in_stroke]
+        duration = np.where(let_ring, tempo, values[:, 1:][in_stroke])
+
+        return cls(
+            string_number=np.repeat([stroke.string_number for _, stroke in strokes], stroke_lengths).astype(np.int16),
+            fret=np.frombuffer(b''.join(stroke.frets for _, stroke in strokes), dtype=np.uint8).astype(np.int16),
+            start_time=np.repeat(element_start[stroke_element], stroke_lengths) + stroke_time,
+            duration=duration,
+            stroke_time=stroke_time
+        )
+
+
+@dataclass(**SLOTS)
 class GuitarSheet:
     """
     Data model representing a complete guitar tab sheet, including metadata and performance instructions.
@@ -161,15 +308,34 @@ class GuitarSheet:
         The tempo of the performance in beats per minute (default 60 BPM).
     capo_fret : int
         The fret number where a capo is placed (default is 0, no capo).
+    notes : NoteArrays
+        Structure-of-arrays view of the notes of `sequence` at tempo `bpm` (read-only, see `notes`).
     """
     title: str
     author: str
     sequence: List[SequenceElement]
     bpm: int = 60
     capo_fret: int = 0
-
-
-@dataclass
+    _notes: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def notes(self) -> NoteArrays:
+        """
+        Structure-of-arrays view of the notes of `sequence` at tempo `bpm`, built on first access and rebuilt
+        whenever `bpm` changes or `sequence` is replaced. A sequence modified in place must be assigned again to
+        be picked up.
+
+        Returns
+        -------
+        NoteArrays
+            The notes of the sheet laid out on the timeline.
+        """
+        if self._notes is None or self._notes[0] != self.bpm or self._notes[1] is not self.sequence:
+            self._notes = (self.bpm, self.sequence, NoteArrays.from_sequence(self.sequence, self.bpm))
+        return self._notes[2]
+
+
+@dataclass(frozen=True, **SLOTS)
 class String:
     """
     Representation of a guitar string's physical and acoustic properties, encapsulating vibrato and
@@ -203,8 +369,8 @@ class String:
         The final decay rate during the very slow phase.
     very_slow_decay_weight : float
         Contribution of the very slow decay to the overall sustain.
-    harmonics_weights : List[float]
-        List of weights for harmonic partials, shaping the timbre of the string.
+    harmonics_weights : Tuple[float, ...]
+        Weights for harmonic partials, shaping the timbre of the string (any sequence is stored as a tuple).
     """
     base_frequency: float
     inharmonicity_coefficient: float
@@ -219,10 +385,101 @@ class String:
     mid_decay_weight: float
     very_slow_decay_rate: float
     very_slow_decay_weight: float
-    harmonics_weights: list
+    harmonics_weights: Tuple[float, ...]
+
+    def __post_init__(self):
+        object.__setattr__(self, 'harmonics_weights', tuple(self.harmonics_weights))
 
 
 @dataclass
+class StringBank:
+    """
+    Structure-of-arrays representation of all the strings of an instrument, holding one NumPy array per physical
+    property so that synthesis can operate on every string at once instead of iterating over `String` objects
+    (e.g. the harmonic factors of all the strings, see `signal_processing.harmonic_profiles`).
+
+    Attributes
+    ----------
+    base_frequency : np.ndarray
+        Open-string fundamental frequencies, one entry per string.
+    inharmonicity_coefficient : np.ndarray
+        Inharmonicity coefficients, one entry per string.
+    vibrato_frequency : np.ndarray
+        Vibrato frequencies, one entry per string.
+    vibrato_amplitude : np.ndarray
+        Vibrato amplitudes, one entry per string.
+    attack_duration : np.ndarray
+        Attack durations, one entry per string.
+    max_duration : np.ndarray
+        Maximum sustain durations, one entry per string.
+    dynamic_range_factor : np.ndarray
+        Dynamic range factors, one entry per string.
+    fast_decay_rate : np.ndarray
+        Fast decay rates, one entry per string.
+    fast_decay_weight : np.ndarray
+        Fast decay weights, one entry per string.
+    mid_decay_rate : np.ndarray
+        Mid decay rates, one entry per string.
+    mid_decay_weight : np.ndarray
+        Mid decay weights, one entry per string.
+    very_slow_decay_rate : np.ndarray
+        Very slow decay rates, one entry per string.
+    very_slow_decay_weight : np.ndarray
+        Very slow decay weights, one entry per string.
+    harmonics_weights : np.ndarray
+        2D array (strings x harmonics) of harmonic weights, zero-padded to the longest list of weights.
+    harmonics_count : np.ndarray
+        Number of meaningful (non-padding) harmonic weights of each string.
+
+    All the arrays are single precision (except `harmonics_count`), halving the bandwidth of the
+    coefficients multiplied against long sample buffers.
+    """
+    base_frequency: np.ndarray
+    inharmonicity_coefficient: np.ndarray
+    vibrato_frequency: np.ndarray
+    vibrato_amplitude: np.ndarray
+    attack_duration: np.ndarray
+    max_duration: np.ndarray
+    dynamic_range_factor: np.ndarray
+    fast_decay_rate: np.ndarray
+    fast_decay_weight: np.ndarray
+    mid_decay_rate: np.ndarray
+    mid_decay_weight: np.ndarray
+    very_slow_decay_rate: np.ndarray
+    very_slow_decay_weight: np.ndarray
+    harmonics_weights: np.ndarray
+    harmonics_count: np.ndarray
+
+    @classmethod
+    def from_strings(cls, strings: List[String]) -> 'StringBank':
+        """
+        Stack the properties of a list of `String` objects into one array per property.
+
+        Parameters
+        ----------
+        strings : List[String]
+            The strings of the instrument.
+
+        Returns
+        -------
+        StringBank
+            The structure-of-arrays view of the strings.
+        """
+        scalar_properties = {
+            f.name: np.array([getattr(string, f.name) for string in strings], dtype=np.float32)
+            for f in fields(cls) if f.name not in ('harmonics_weights', 'harmonics_count')
+        }
+
+        # Pad the harmonic weights with zeros up to the richest string
+        harmonics_count = np.array([len(string.harmonics_weights) for string in strings], dtype=np.int32)
+        harmonics_weights = np.zeros((len(strings), harmonics_count.max(initial=0)), dtype=np.float32)
+        for i, string in enumerate(strings):
+            harmonics_weights[i, :harmonics_count[i]] = string.harmonics_weights
+
+        return cls(harmonics_weights=harmonics_weights, harmonics_count=harmonics_count, **scalar_properties)
+
+
+@dataclass(frozen=True, **SLOTS)
 class Instrument:
     """
     Class encapsulating the musical characteristics of an instrument, emphasizing vibrato and transition capabilities,
@@ -234,10 +491,21 @@ class Instrument:
         Boolean indicating whether the instrument can execute techniques such as slides, hammer-ons, or pull-offs.
     supports_vibrato : bool
         Boolean indicating whether the instrument supports vibrato techniques for enhanced expressiveness.
-    strings : List[String]
-        List of `String` objects representing the strings of the instrument, each with detailed acoustic properties.
+    strings : Tuple[String, ...]
+        The `String` objects of the instrument, each with detailed acoustic properties (any sequence is stored as
+        a tuple).
+    string_bank : StringBank, optional
+        Structure-of-arrays view of `strings`, built from them at construction when not provided.
+
+    Instruments and strings are immutable (frozen, with their sequences stored as tuples), which keeps
+    `string_bank` consistent with `strings` and makes them hashable.
     """
     supports_transitions: bool
     supports_vibrato: bool
-    strings: List[String]
+    strings: Tuple[String, ...]
+    string_bank: Optional[StringBank] = field(default=None, repr=False, compare=False)
 
+    def __post_init__(self):
+        object.__setattr__(self, 'strings', tuple(self.strings))
+        if self.string_bank is None:
+            object.__setattr__(self, 'string_bank', StringBank.from_strings(self.strings))
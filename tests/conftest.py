@@ -0,0 +1,17 @@
+import os
+import shutil
+import tempfile
+
+cache_directory = None
+
+
+def pytest_configure(config):
+    # Cache the parsed assets in a temporary directory instead of the user's cache directory. This runs before the
+    # test modules are collected, which already load the default assets.
+    global cache_directory
+    cache_directory = tempfile.mkdtemp(prefix='py_guitar_synth_cache_')
+    os.environ['PY_GUITAR_SYNTH_CACHE_DIR'] = cache_directory
+
+
+def pytest_unconfigure(config):
+    shutil.rmtree(cache_directory, ignore_errors=True)
@@ -1,4 +1,11 @@
-from py_guitar_synth.instrument_parser import load_instrument_from_json
+import json
+import pathlib
+import numpy as np
+import pytest
+from py_guitar_synth.types import StringBank
+from py_guitar_synth.instruments import cache_path_for, cached_load, load_cached_impulse_response, \
+    load_cached_instrument
+from py_guitar_synth.instrument_parser import load_instrument_from_json, load_impulse_response, remove_json_comments
 
 
 def test_load_instrument_from_json():
@@ -8,3 +15,81 @@ def test_load_instrument_from_json():
     assert instrument is not None
     assert len(instrument.strings) > 0  # The instrument should have strings
     assert instrument.supports_vibrato is True  # The classical guitar does support a vibrato
+
+
+def test_load_instrument_from_path_and_file():
+    path = pathlib.Path('py_guitar_synth/assets/classical_guitar.json')
+    with path.open('r') as file:
+        from_file = load_instrument_from_json(file)
+
+    assert load_instrument_from_json(path) == from_file == load_instrument_from_json(str(path))
+
+
+def test_remove_json_comments_keeps_strings():
+    content = '{\n  "source": "http://example.com",  // Where the values come from\n  "name": "a \\" // b"\n}'
+    data = json.loads(remove_json_comments(content))
+
+    assert data["source"] == "http://example.com"  # '//' inside a string is not a comment
+    assert data["name"] == 'a " // b'  # Escaped quotes do not end the string
+
+
+def test_load_impulse_response():
+    ir = load_impulse_response('py_guitar_synth/assets/ir.wav')
+
+    assert ir.dtype == np.float32  # Decoded in single precision
+    assert ir.ndim == 2 and ir.shape[1] == 2  # The default impulse response is stereo
+
+
+def test_string_bank():
+    instrument = load_instrument_from_json('py_guitar_synth/assets/classical_guitar.json')
+    bank = instrument.string_bank
+
+    assert bank.base_frequency.shape == (len(instrument.strings),)
+    assert bank.base_frequency[0] == np.float32(instrument.strings[0].base_frequency)  # Stored in single precision
+
+    # Harmonic weights are zero-padded to the richest string
+    longest = max(len(string.harmonics_weights) for string in instrument.strings)
+    assert bank.harmonics_weights.shape == (len(instrument.strings), longest)
+    assert bank.harmonics_weights.dtype == np.float32
+    assert list(bank.harmonics_count) == [len(string.harmonics_weights) for string in instrument.strings]
+
+
+def test_cached_load(tmp_path, monkeypatch):
+    monkeypatch.setenv('PY_GUITAR_SYNTH_CACHE_DIR', str(tmp_path / 'cache'))
+    source = pathlib.Path('py_guitar_synth/assets/classical_guitar.json')
+    cache_path = cache_path_for(source, '.npz')
+
+    def failing_dump(value, file):
+        file.write(b'partial')
+        raise RuntimeError("dump failed")
+
+    # A failed write leaves neither a cache nor its temporary file behind, and nothing next to the assets
+    with pytest.raises(RuntimeError):
+        cached_load(source, cache_path, load_instrument_from_json, failing_dump, None)
+    assert not list((tmp_path / 'cache').iterdir())
+    assert not [path for path in source.parent.iterdir() if path.suffix in ('.npz', '.npy', '.pkl', '.tmp')]
+
+    instrument = load_cached_instrument(source)
+    assert [path.name for path in (tmp_path / 'cache').iterdir()] == [pathlib.Path(cache_path).name]
+    assert load_cached_instrument(source) == instrument  # Served from the cache
+    assert np.array_equal(instrument.string_bank.harmonics_weights, StringBank.from_strings(
+        instrument.strings).harmonics_weights)
+
+
+def test_cached_impulse_response(tmp_path, monkeypatch):
+    monkeypatch.setenv('PY_GUITAR_SYNTH_CACHE_DIR', str(tmp_path))
+
+    # The impulse response is memory-mapped read-only, whether the cache was just written or already there
+    for _ in range(2):
+        ir = load_cached_impulse_response('py_guitar_synth/assets/ir.wav')
+        assert isinstance(ir, np.memmap) and not ir.flags.writeable
+
+
+def test_instrument_is_immutable():
+    instrument = load_instrument_from_json('py_guitar_synth/assets/classical_guitar.json')
+
+    # The strings and their harmonic weights are tuples, so the instrument is hashable and its bank cannot go stale
+    assert isinstance(instrument.strings, tuple) and isinstance(instrument.strings[0].harmonics_weights, tuple)
+    assert hash(instrument) == hash(load_instrument_from_json('py_guitar_synth/assets/classical_guitar.json'))
+    with pytest.raises(TypeError):
+        instrument.strings[0] = instrument.strings[1]
@@ -1,5 +1,11 @@
 import numpy as np
-from py_guitar_synth.signal_processing import add_echo, normalize_audio
+from py_guitar_synth import default_classical_guitar, signal_processing, NoteEvent
+from py_guitar_synth.tab_parser import parse_guitar_tab, parse_guitar_tab_from_string
+from py_guitar_synth.signal_processing import add_echo, normalize_audio, \
+    convolve_with_impulse_response, echo_impulse_response, lookup_sine, modal_adjustment, StreamingConvolver, \
+    StreamingEcho, fftconvolve, generate_guitar_signal_from_sheet, harmonic_profiles, next_fast_len, noise_length, \
+    process_sequence_element, stream_guitar_signal_from_sheet, synthesize_notes, synthesize_sequence, synthesize_tone, \
+    tone_envelopes
 
 
 def test_normalize_audio():
@@ -7,3 +13,214 @@ def test_normalize_audio():
     normalized_signal = normalize_audio(signal)
 
     assert np.max(np.abs(normalized_signal)) == 0.95  # Normalized peak should be 0.95
+
+
+def test_convolve_with_impulse_response():
+    rng = np.random.default_rng(0)
+    signal = rng.standard_normal(1000)
+    ir = rng.standard_normal((300, 2))
+
+    # The partitioned convolution matches a direct convolution truncated to the signal length (in single precision)
+    convolved = convolve_with_impulse_response(signal, ir, block_size=64)
+    expected = np.stack([np.convolve(signal, ir[:, channel])[:len(signal)] for channel in range(2)], axis=1)
+
+    assert convolved.shape == (len(signal), 2)
+    assert np.allclose(convolved, expected, atol=1e-4)
+    mono = convolve_with_impulse_response(signal, ir[:, 0].copy(), block_size=64)
+    assert np.allclose(mono, expected[:, 0], atol=1e-4)
+    assert np.allclose(convolve_with_impulse_response(signal, ir), expected, atol=1e-4)  # Automatic block size
+
+
+def test_convolve_in_batches(monkeypatch):
+    rng = np.random.default_rng(1)
+    signal = rng.standard_normal(1000)
+    ir = rng.standard_normal((300, 2))
+    expected = convolve_with_impulse_response(signal, ir, block_size=64)
+
+    # Batches of two blocks, shorter than the five partitions of the impulse response
+    monkeypatch.setattr(signal_processing, 'CONVOLUTION_BATCH_SIZE', 128)
+    assert np.allclose(convolve_with_impulse_response(signal, ir, block_size=64), expected, atol=1e-5)
+
+
+def test_add_echo_mono():
+    signal = np.array([1.0, 0.0, 0.0, 0.0])
+    echoed = add_echo(signal, delay=2, decay=0.5, sr=1)
+
+    assert np.array_equal(echoed, [1.0, 0.0, 0.5, 0.0])  # Same length, delayed and decayed copy
+
+
+def test_add_echo_stereo():
+    signal = np.array([[1.0, 2.0], [0.0, 0.0]])
+    echoed = add_echo(signal, delay=1, decay=0.5, sr=1)
+
+    assert np.array_equal(echoed, [[1.0, 2.0], [0.5, 1.0], [0.0, 0.0]])  # Frames x channels, with the echo tail
+
+
+def test_lookup_sine():
+    cycles = np.linspace(0, 500, 100000)
+
+    assert np.max(np.abs(lookup_sine(cycles) - np.sin(2 * np.pi * cycles))) < 1e-4
+
+
+def test_streaming_convolution_and_echo():
+    rng = np.random.default_rng(0)
+    signal = rng.standard_normal(1000)
+    ir = rng.standard_normal((300, 2))
+
+    # Processing the signal in blocks matches the one-shot convolution and echo
+    convolver = StreamingConvolver(ir, block_size=64)
+    echo = StreamingEcho(delay=100, decay=0.5, sr=1)
+    streamed = np.concatenate([
+        echo.process_block(convolver.process_block(signal[start:start + 64])) for start in range(0, len(signal), 64)
+    ])
+    expected = add_echo(convolve_with_impulse_response(signal, ir, block_size=64), delay=100, decay=0.5, sr=1)
+
+    assert np.allclose(streamed, expected[:len(signal)], atol=1e-4)
+
+
+def test_fftconvolve():
+    rng = np.random.default_rng(0)
+    x = rng.standard_normal(1009)
+    y = rng.standard_normal(211)
+
+    assert next_fast_len(len(x) + len(y) - 1) == 1250  # Smallest 5-smooth length of at least 1219 (2 * 5 ** 4)
+    assert np.allclose(fftconvolve(x, y), np.convolve(x, y))
+
+    stereo = np.stack([y, -y], axis=1)
+    assert np.allclose(fftconvolve(x, stereo), np.stack([np.convolve(x, y), -np.convolve(x, y)], axis=1))
+
+
+def test_modal_adjustment():
+    # Plucking at 0.7 is near the nodes 7/10 and 14/20, the fundamental has no inner node
+    harmonics = np.arange(1, 21)
+    expected = np.where(np.isin(harmonics, [10, 20]), 0.0, 1.0)
+
+    assert np.array_equal(modal_adjustment(harmonics, 0.7), expected)
+    assert modal_adjustment(2, 0.502) == 0.0
+    assert modal_adjustment(1, 0.5) == 1.0
+
+
+def test_echo_impulse_response():
+    rng = np.random.default_rng(0)
+    signal = rng.standard_normal(1000)
+    ir = rng.standard_normal(300)
+
+    # Convolving with the echo folded into the impulse response is the same as adding the echo afterwards
+    echo_ir = echo_impulse_response(ir, delay=100, decay=0.5, sr=1)
+    expected = add_echo(convolve_with_impulse_response(signal, ir), delay=100, decay=0.5, sr=1)
+
+    assert len(echo_ir) == 400
+    assert np.allclose(convolve_with_impulse_response(signal, echo_ir), expected, atol=1e-4)
+    assert echo_impulse_response(ir, delay=100, decay=0.5, sr=1) is echo_ir  # Cached
+
+
+def test_synthesize_sequence_memory_mapped(monkeypatch):
+    sequence = parse_guitar_tab("""
+    e |--0-----3-------|
+    B |----------------|
+    G |----------------|
+    D |--2-------------|
+    A |--0---2---------|
+    E |----------------|
+    """)
+
+    def render():
+        monkeypatch.setattr(signal_processing, 'noise_generator', np.random.default_rng(0))
+        return synthesize_sequence(default_classical_guitar, sequence, capo_fret=0, tempo=0.5)
+
+    in_memory = render()
+
+    # Rendering into memory-mapped string buffers gives the same signal
+    monkeypatch.setattr(signal_processing, 'MEMMAP_THRESHOLD', 0)
+    assert np.array_equal(render(), in_memory)
+
+
+def test_harmonic_profiles():
+    strings = default_classical_guitar.strings
+    profiles = harmonic_profiles(default_classical_guitar.string_bank, 0.7)
+
+    # Every string keeps its own harmonics, the zero padding of the bank is dropped
+    assert [len(amplitudes) for _, _, amplitudes in profiles] == [len(s.harmonics_weights) for s in strings]
+    for string, (frequency_factors, decay_rates, amplitudes) in zip(strings, profiles):
+        h = np.arange(1, len(string.harmonics_weights) + 1)
+        assert np.allclose(frequency_factors, h * (1 + string.inharmonicity_coefficient * h ** 2))
+        assert np.allclose(decay_rates, -h / 6)
+        expected = np.asarray(string.harmonics_weights) * np.sin(np.pi * 0.7 * h) * modal_adjustment(h, 0.7)
+        assert amplitudes.dtype == np.float32 and np.allclose(amplitudes, expected, atol=1e-6)
+
+
+def test_stream_keeps_echo_tail(monkeypatch):
+    sheet = parse_guitar_tab_from_string("""
+e |--0-----3-------|
+A |--0---2---------|
+""")
+
+    def render(renderer, **options):
+        monkeypatch.setattr(signal_processing, 'noise_generator', np.random.default_rng(0))
+        return renderer(default_classical_guitar, sheet, echo_delay=0.3, **options)
+
+    # The streamed signal rings on with the echo like the one-shot render, with or without convolution
+    for apply_convolution in (True, False):
+        rendered = render(generate_guitar_signal_from_sheet, apply_convolution=apply_convolution)
+        streamed = np.concatenate(list(render(stream_guitar_signal_from_sheet, apply_convolution=apply_convolution)))
+        assert streamed.shape == rendered.shape
+
+        # The running peak of the streamed signal reaches that of the whole signal at its loudest sample, from
+        # which both signals are the same, echo tail included
+        peak = int(np.argmax(np.abs(rendered).reshape(len(rendered), -1).max(axis=1)))
+        assert peak < len(rendered) - int(0.3 * 44100)
+        assert np.allclose(streamed[peak:], rendered[peak:], atol=1e-5)
+
+
+def test_synthesize_tone_noise_length():
+    duration, decay_t0 = 0.8624934103093652, -0.07946111422475943
+    t = np.linspace(0, duration, int(44100 * duration), endpoint=False)
+
+    # Rounding the time array to single precision moves the noise floor of this tone by one sample, the length of
+    # the noise envelope is taken from the double precision time array
+    assert noise_length(t, decay_t0) != noise_length(t.astype(np.float32), decay_t0)
+    noise_envelope = tone_envelopes(default_classical_guitar, 1, duration, decay_t0, 44100)[3]
+    assert len(noise_envelope) == noise_length(t, decay_t0)
+
+    tone = synthesize_tone(default_classical_guitar, 1, 0, duration=duration, decay_t0=decay_t0)
+    assert len(tone) == int(44100 * duration)
+    assert np.isfinite(tone).all()
+
+
+def test_synthesize_notes_in_order():
+    notes = [NoteEvent(string_number=1, fret=0, start_time=0.0, duration=0.01 * i, decay_t0=0.0) for i in range(1, 10)]
+
+    # More notes than the submission window of two threads, the tones still come in the order of the notes
+    tones = list(synthesize_notes(default_classical_guitar, notes, num_workers=2))
+    assert [len(tone) for tone in tones] == [int(44100 * note.duration) for note in notes]
+
+
+def test_synthesize_sequence_worker_count(monkeypatch):
+    sequence = parse_guitar_tab("""
+    e |--0-1-3-5-7-8-a-c-|
+    A |--0---2---3---5---|
+    """)
+
+    def render(num_workers):
+        monkeypatch.setattr(signal_processing, 'noise_generator', np.random.default_rng(0))
+        return synthesize_sequence(default_classical_guitar, sequence, capo_fret=0, tempo=0.5, num_workers=num_workers)
+
+    # Every note draws its noise from its own stream, so a seeded render does not depend on the thread count
+    assert np.array_equal(render(1), render(4))
+
+
+def test_process_sequence_element():
+    sequence = parse_guitar_tab("""
+    e |--0-3-|
+    A |--0---|
+    """)
+    string_buffers = [np.zeros(0) for _ in range(6)]
+
+    # The elements are placed one after the other, every tone at its start on the buffer of its string
+    total_time = 0.0
+    for element in sequence:
+        total_time = process_sequence_element(default_classical_guitar, element, 0, 0.5, 0.7, string_buffers,
+                                              total_time, 44100)
+
+    assert total_time == 0.25
+    assert [len(buffer) for buffer in string_buffers] == [2 * int(0.125 * 44100), 0, 0, 0, int(0.125 * 44100), 0]
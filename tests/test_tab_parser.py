@@ -1,4 +1,7 @@
-from py_guitar_synth.tab_parser import parse_guitar_tab, parse_guitar_tab_from_file
+import numpy as np
+import pytest
+from py_guitar_synth import GuitarSheet, NoteValue, SequenceElement, Stroke
+from py_guitar_synth.tab_parser import parse_guitar_tab, parse_guitar_tab_from_file, parse_guitar_tab_from_string
 
 
 def test_parse_guitar_tab():
@@ -24,3 +27,57 @@ def test_parse_guitar_tab_from_file():
 
     assert sheet is not None
     assert len(sheet.sequence) > 0  # There should be a sequence of strokes in the sheet
+
+
+def test_parse_guitar_tab_metadata():
+    sheet = parse_guitar_tab_from_string("""Title:  Test Sheet
+Author: Someone
+bpm:    90
+capo fret: 2
+
+e |--0-----|
+B |--1-----|
+""")
+
+    assert (sheet.title, sheet.author, sheet.bpm, sheet.capo_fret) == ('Test Sheet', 'Someone', 90, 2)
+    assert len(sheet.sequence) == 1  # The metadata lines are not parsed as tab lines
+
+
+def test_sheet_note_arrays():
+    sheet = parse_guitar_tab_from_file('py_guitar_synth/assets/law_bass.txt')
+    num_notes = sum(len(stroke.frets) for element in sheet.sequence for stroke in element.strokes)
+
+    assert len(sheet.notes.start_time) == num_notes  # One entry per note of the sequence
+    assert sheet.notes.string_number.min() >= 1 and sheet.notes.string_number.max() <= 6
+    assert (sheet.notes.duration > 0).all()
+
+
+def test_sheet_notes_follow_tempo():
+    sheet = parse_guitar_tab_from_file('py_guitar_synth/assets/law_bass.txt')
+    start_time = sheet.notes.start_time
+
+    # Changing the tempo of a sheet reschedules its notes
+    sheet.bpm *= 2
+    assert np.allclose(sheet.notes.start_time, start_time / 2)
+
+    sheet.sequence = sheet.sequence[:1]
+    assert len(sheet.notes.start_time) == sum(len(stroke.frets) for stroke in sheet.sequence[0].strokes)
+
+
+def test_hand_built_sheet():
+    # Frets given as a list of ints are stored as bytes, like those of parsed strokes
+    stroke = Stroke(string_number=1, frets=[0, 2], values=[NoteValue.quarterNote, NoteValue.eighthNote])
+    sheet = GuitarSheet(title='Test', author='Someone', sequence=[SequenceElement(strokes=[stroke])])
+
+    assert stroke.frets == bytes([0, 2])
+    assert list(sheet.notes.fret) == [0, 2]
+    assert np.allclose(sheet.notes.start_time, [0.0, 0.25])
+    assert Stroke(string_number=1, frets=np.array([3, 12]), values=stroke.values).frets == bytes([3, 12])
+
+    # A single fret number, frets that are not numbers and frets that do not fit in a byte are rejected
+    for frets in (3, None, '02', [0, 2.5]):
+        with pytest.raises(TypeError, match='frets must be a sequence of fret numbers'):
+            Stroke(string_number=1, frets=frets, values=[NoteValue.quarterNote])
+    for frets in ([256], [-1, 2]):
+        with pytest.raises(ValueError, match='frets must be between 0 and 255'):
+            Stroke(string_number=1, frets=frets, values=[NoteValue.quarterNote])